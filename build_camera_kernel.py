@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Camera Kernel Build Script for GoLive Studio
+Compiles camera_kernel.pyx in place so camera_processor can import it
+"""
+
+import os
+import sys
+import platform
+import tempfile
+from pathlib import Path
+
+
+def openmp_flags():
+    """Return (compile_args, link_args) enabling OpenMP for the current compiler."""
+    system = platform.system().lower()
+    if system == 'windows':
+        return ['/O2', '/openmp'], []
+    if system == 'darwin':
+        # Apple clang ships without libomp; prange then runs on one thread
+        return ['-O3'], []
+    return ['-O3', '-fopenmp'], ['-fopenmp']
+
+
+def main():
+    """Build the camera kernel extension next to camera_processor.py."""
+    project_root = Path(__file__).parent
+
+    print("🚀 GoLive Studio Camera Kernel Builder")
+    print(f"💻 Platform: {platform.system()}")
+
+    try:
+        import numpy  # noqa: F401  (memoryviews are filled from numpy frames)
+        from Cython.Build import cythonize
+        from setuptools import Extension, setup
+    except ImportError as e:
+        print(f"❌ Missing build dependency: {e}")
+        print("   Install with: pip install cython setuptools numpy")
+        sys.exit(1)
+
+    # build_ext --inplace drops top-level modules into the working directory
+    os.chdir(project_root)
+    
+    compile_args, link_args = openmp_flags()
+    extension = Extension(
+        'camera_kernel',
+        ['camera_kernel.pyx'],
+        extra_compile_args=compile_args,
+        extra_link_args=link_args,
+    )
+
+    try:
+        # Intermediate files go to a throwaway directory instead of build/temp.* and
+        # build/lib.* in the repo; the generated camera_kernel.c stays (it is gitignored)
+        # so unchanged sources skip Cython
+        with tempfile.TemporaryDirectory(prefix='camera_kernel-') as build_temp:
+            setup(
+                name='camera_kernel',
+                ext_modules=cythonize(
+                    [extension],
+                    compiler_directives={'boundscheck': False, 'wraparound': False},
+                    annotate=False,
+                ),
+                script_args=['build_ext', '--inplace', '--build-temp', build_temp,
+                             '--build-lib', build_temp],
+            )
+        print("\n✅ camera_kernel built successfully!")
+    except SystemExit as e:
+        if e.code:
+            print(f"\n❌ camera_kernel build failed: {e}")
+            sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ camera_kernel build failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
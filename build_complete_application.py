@@ -10,6 +10,7 @@ import sys
 import subprocess
 import shutil
 import platform
+import hashlib
 import requests
 import zipfile
 import tarfile
@@ -19,14 +20,27 @@ import json
 import time
 
 
+# Platform detection, evaluated once at import
+IS_WINDOWS = sys.platform.startswith('win')
+IS_MACOS = sys.platform == 'darwin'
+IS_LINUX = sys.platform.startswith('linux')
+FFMPEG_BIN_NAME = 'ffmpeg.exe' if IS_WINDOWS else 'ffmpeg'
+
+# Downloaded FFmpeg archives are kept here between builds, keyed by URL and
+# revalidated with their ETag/Last-Modified
+FFMPEG_CACHE_DIR = Path.home() / '.cache' / 'golive-studio'
+
+
 class CompleteApplicationBuilder:
     """Comprehensive builder for GoLive Studio applications."""
     
+    # Kept as attributes for callers that still read them off the builder
+    is_windows = IS_WINDOWS
+    is_macos = IS_MACOS
+    is_linux = IS_LINUX
+    
     def __init__(self):
         self.project_root = Path(__file__).parent
-        self.is_windows = sys.platform.startswith('win')
-        self.is_macos = sys.platform == 'darwin'
-        self.is_linux = sys.platform.startswith('linux')
         
         # Build directories
         self.build_dir = self.project_root / 'build'
@@ -112,12 +126,7 @@ class CompleteApplicationBuilder:
         self.ffmpeg_dir.mkdir(exist_ok=True)
         
         # Check if FFmpeg already exists
-        if self.is_macos:
-            ffmpeg_binary = self.ffmpeg_dir / 'ffmpeg'
-        elif self.is_windows:
-            ffmpeg_binary = self.ffmpeg_dir / 'ffmpeg.exe'
-        else:
-            ffmpeg_binary = self.ffmpeg_dir / 'ffmpeg'
+        ffmpeg_binary = self.ffmpeg_dir / FFMPEG_BIN_NAME
         
         if ffmpeg_binary.exists():
             print(f"   ✅ FFmpeg already exists: {ffmpeg_binary}")
@@ -194,43 +203,103 @@ class CompleteApplicationBuilder:
         except Exception as e:
             print(f"   ⚠️ Linux FFmpeg setup failed: {e}")
     
+    def get_ffmpeg_cache_path(self, url: str, archive_type: str) -> Path:
+        """Return the cache path for an FFmpeg archive, keyed by its URL."""
+        digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return FFMPEG_CACHE_DIR / f'ffmpeg-{digest}.{archive_type}'
+    
+    def fetch_ffmpeg_archive(self, url: str, archive_type: str) -> Path:
+        """Return a local copy of the FFmpeg archive, revalidating a cached copy with one conditional GET."""
+        cache_path = self.get_ffmpeg_cache_path(url, archive_type)
+        meta_path = cache_path.with_name(cache_path.name + '.json')
+        
+        # Validators saved with the cached copy make the GET conditional
+        headers = {}
+        if cache_path.exists() and meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        
+        if headers:
+            print(f"   🔎 Checking cached FFmpeg archive against {url}")
+        else:
+            print(f"   📥 Downloading from {url}")
+        try:
+            response = requests.get(url, headers=headers, stream=True, timeout=60)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if not headers:
+                raise
+            print(f"   ⚠️ Could not revalidate FFmpeg archive ({e}), using the cached copy")
+            return cache_path
+        
+        with response:
+            if response.status_code == 304:
+                print(f"   ✅ Using cached FFmpeg archive: {cache_path}")
+                return cache_path
+            
+            # Download to a partial file so an interrupted build never leaves a bad cache entry
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path = cache_path.with_name(cache_path.name + '.part')
+            with open(partial_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    f.write(chunk)
+            os.replace(partial_path, cache_path)
+            
+            meta_path.write_text(json.dumps({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }))
+        
+        return cache_path
+    
     def download_and_extract_ffmpeg(self, url: str, archive_type: str):
         """Download and extract FFmpeg from URL."""
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             
-            # Download
-            print(f"   📥 Downloading from {url}")
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+            # Download (or reuse the cached archive)
+            archive_path = self.fetch_ffmpeg_archive(url, archive_type)
             
             if archive_type == 'zip':
-                archive_path = temp_path / 'ffmpeg.zip'
-                with open(archive_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
                 # Extract
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
                     zip_ref.extractall(temp_path)
             
             elif archive_type == 'tar.xz':
-                archive_path = temp_path / 'ffmpeg.tar.xz'
-                with open(archive_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                # Extract
-                with tarfile.open(archive_path, 'r:xz') as tar_ref:
-                    tar_ref.extractall(temp_path)
+                # Extract, using multi-threaded xz when it is on PATH
+                if shutil.which('xz'):
+                    proc = subprocess.Popen(
+                        ['xz', '-dc', '-T0', str(archive_path)],
+                        stdout=subprocess.PIPE
+                    )
+                    try:
+                        with tarfile.open(fileobj=proc.stdout, mode='r|') as tar_ref:
+                            tar_ref.extractall(temp_path)
+                    except BaseException:
+                        # xz may still be writing; don't leave it running behind the error
+                        proc.kill()
+                        raise
+                    finally:
+                        proc.stdout.close()
+                        proc.wait()
+                    if proc.returncode != 0:
+                        raise RuntimeError(f"xz exited with status {proc.returncode}")
+                else:
+                    with tarfile.open(archive_path, 'r:xz') as tar_ref:
+                        tar_ref.extractall(temp_path)
             
             # Find and copy FFmpeg binary
             for ffmpeg_file in temp_path.rglob('ffmpeg*'):
                 if ffmpeg_file.is_file() and 'ffmpeg' in ffmpeg_file.name:
                     if not ffmpeg_file.name.endswith(('.txt', '.md', '.html')):
-                        target_name = 'ffmpeg.exe' if self.is_windows else 'ffmpeg'
-                        shutil.copy2(ffmpeg_file, self.ffmpeg_dir / target_name)
-                        os.chmod(self.ffmpeg_dir / target_name, 0o755)
+                        shutil.copy2(ffmpeg_file, self.ffmpeg_dir / FFMPEG_BIN_NAME)
+                        os.chmod(self.ffmpeg_dir / FFMPEG_BIN_NAME, 0o755)
                         print(f"   ✅ Extracted FFmpeg: {ffmpeg_file.name}")
                         return
     
@@ -259,7 +328,7 @@ class CompleteApplicationBuilder:
             return False
         
         # Check FFmpeg
-        ffmpeg_binary = self.ffmpeg_dir / ('ffmpeg.exe' if self.is_windows else 'ffmpeg')
+        ffmpeg_binary = self.ffmpeg_dir / FFMPEG_BIN_NAME
         if ffmpeg_binary.exists():
             print(f"   ✅ FFmpeg: {ffmpeg_binary}")
         else:
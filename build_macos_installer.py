@@ -6,20 +6,46 @@ Creates a professional DMG installer with proper installation flow and FFmpeg bu
 
 import os
 import sys
+import ctypes
+import ctypes.util
+import hashlib
+import platform
 import subprocess
 import shutil
 import requests
 import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
 from pathlib import Path
 import plistlib
 
+# Downloaded FFmpeg binaries are kept here between builds, keyed by release URL and ETag
+FFMPEG_CACHE_DIR = Path.home() / ".cache" / "golive-studio" / "ffmpeg"
+
+# Mach-O magic numbers: 32/64-bit in both byte orders, plus universal (fat) binaries
+MACHO_MAGICS = {
+    bytes.fromhex("feedface"), bytes.fromhex("cefaedfe"),
+    bytes.fromhex("feedfacf"), bytes.fromhex("cffaedfe"),
+    bytes.fromhex("cafebabe"), bytes.fromhex("bebafeca"),
+}
+
+# Bundles nested in the .app that carry their own signature
+NESTED_BUNDLE_SUFFIXES = (".framework", ".app", ".appex", ".bundle", ".plugin", ".xpc")
+
 class MacOSInstallerBuilder:
-    def __init__(self):
+    def __init__(self, use_cache=True):
         self.project_root = Path(__file__).parent
         self.build_dir = self.project_root / "build"
         self.dist_dir = self.project_root / "dist"
         self.ffmpeg_dir = self.build_dir / "ffmpeg"
         self.dmg_staging = self.build_dir / "dmg_staging"
+        self.pkg_staging = self.build_dir / "pkg_staging"
+        self.spec_path = self.project_root / "GoLive_Studio_Enhanced.spec"
+        # Kept inside build/ so wiping the PyInstaller cache also forces a clean build
+        self.spec_hash_path = self.build_dir / "GoLive_Studio_Enhanced.spec.hash"
+        self.spec_changed = True
+        self.use_cache = use_cache
         
     def setup_directories(self):
         """Create necessary build directories"""
@@ -35,6 +61,10 @@ class MacOSInstallerBuilder:
         if ffmpeg_exe.exists():
             print("✅ FFmpeg already exists")
             return
+        # exists() is False for a dangling link left by an evicted cache entry; clear it
+        # so nothing below writes through it
+        if ffmpeg_exe.is_symlink():
+            ffmpeg_exe.unlink()
             
         # Try to use system FFmpeg first
         try:
@@ -42,30 +72,41 @@ class MacOSInstallerBuilder:
             if system_ffmpeg.returncode == 0:
                 ffmpeg_path = system_ffmpeg.stdout.strip()
                 print(f"✅ Found system FFmpeg at: {ffmpeg_path}")
-                shutil.copy2(ffmpeg_path, ffmpeg_exe)
+                # copyfile uses fcopyfile/sendfile, which clones on APFS
+                shutil.copyfile(ffmpeg_path, ffmpeg_exe)
                 os.chmod(ffmpeg_exe, 0o755)
                 return
         except Exception:
             pass
             
+        # Use a reliable FFmpeg build for macOS
+        ffmpeg_url = "https://evermeet.cx/ffmpeg/getrelease/zip"
+        cache_dir = None
+        if self.use_cache:
+            cache_key = self.release_cache_key(ffmpeg_url)
+            if cache_key:
+                cache_dir = FFMPEG_CACHE_DIR / hashlib.sha256(cache_key.encode()).hexdigest()[:16]
+        
+        if cache_dir and self.verify_cached_ffmpeg(cache_dir):
+            print(f"✅ Using cached FFmpeg: {cache_dir}")
+            # A copy (an APFS clone) stays valid if the cache entry is later evicted
+            shutil.copyfile(cache_dir / "ffmpeg", ffmpeg_exe)
+            os.chmod(ffmpeg_exe, 0o755)
+            return
+            
         # Download FFmpeg if not available
         print("⬇️ Downloading FFmpeg for macOS...")
         try:
-            # Use a reliable FFmpeg build for macOS
-            ffmpeg_url = "https://evermeet.cx/ffmpeg/getrelease/zip"
-            
             response = requests.get(ffmpeg_url, stream=True)
             response.raise_for_status()
             
             zip_path = self.build_dir / "ffmpeg.zip"
+            response.raw.decode_content = True
             with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
                     
             print("📂 Extracting FFmpeg...")
-            import zipfile
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.ffmpeg_dir)
+            self.extract_zip_parallel(zip_path, self.ffmpeg_dir)
                 
             # Make executable
             os.chmod(ffmpeg_exe, 0o755)
@@ -73,6 +114,9 @@ class MacOSInstallerBuilder:
             # Cleanup
             zip_path.unlink()
             
+            if cache_dir:
+                self.store_cached_ffmpeg(ffmpeg_exe, cache_dir)
+            
             print("✅ FFmpeg downloaded and extracted")
             
         except Exception as e:
@@ -80,6 +124,67 @@ class MacOSInstallerBuilder:
             print("Please install FFmpeg manually: brew install ffmpeg")
             sys.exit(1)
             
+    def release_cache_key(self, url):
+        """Final URL plus ETag or Last-Modified of the current release, or None if unknown"""
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException:
+            return None
+        
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        if not validator:
+            return None
+        return f"{response.url}\n{validator}"
+        
+    def file_sha256(self, path):
+        """SHA-256 hex digest of a file, read in 1 MiB blocks"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+        
+    def verify_cached_ffmpeg(self, cache_dir):
+        """True if cache_dir holds an FFmpeg binary matching its recorded checksum"""
+        cached_exe = cache_dir / "ffmpeg"
+        checksum_path = cache_dir / "ffmpeg.sha256"
+        if not cached_exe.exists() or not checksum_path.exists():
+            return False
+            
+        if self.file_sha256(cached_exe) != checksum_path.read_text().strip():
+            print("⚠️ Cached FFmpeg is corrupt, downloading again")
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            return False
+            
+        return True
+        
+    def store_cached_ffmpeg(self, ffmpeg_exe, cache_dir):
+        """Copy a freshly downloaded FFmpeg into the cache with its checksum"""
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(ffmpeg_exe, cache_dir / "ffmpeg")
+            os.chmod(cache_dir / "ffmpeg", 0o755)
+            (cache_dir / "ffmpeg.sha256").write_text(self.file_sha256(ffmpeg_exe))
+        except OSError as e:
+            print(f"⚠️ Could not cache FFmpeg: {e}")
+            
+    def extract_zip_parallel(self, zip_path, dest_dir):
+        """Extract zip members concurrently; zlib releases the GIL while inflating"""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = [info for info in zip_ref.infolist() if not info.is_dir()]
+            if len(members) <= 1:
+                zip_ref.extractall(dest_dir)
+                return
+                
+        def extract_member(info):
+            # ZipFile handles are not thread-safe, so each worker opens its own
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extract(info, dest_dir)
+                
+        with ThreadPoolExecutor(max_workers=min(len(members), os.cpu_count() or 1)) as executor:
+            list(executor.map(extract_member, members))
+            
     def create_enhanced_spec(self):
         """Create enhanced PyInstaller spec for macOS"""
         print("📝 Creating enhanced PyInstaller spec...")
@@ -261,32 +366,68 @@ app = BUNDLE(
 )
 '''
         
-        spec_path = self.project_root / "GoLive_Studio_Enhanced.spec"
-        with open(spec_path, 'w') as f:
+        # Leave the spec untouched when it is unchanged so PyInstaller can reuse build/
+        spec_hash = hashlib.blake2b(spec_content.encode()).hexdigest()
+        if (self.spec_path.exists() and self.spec_hash_path.exists()
+                and self.spec_hash_path.read_text().strip() == spec_hash):
+            print("✅ Spec unchanged, reusing previous build cache")
+            self.spec_changed = False
+            return self.spec_path
+            
+        with open(self.spec_path, 'w') as f:
             f.write(spec_content)
+        self.spec_hash_path.parent.mkdir(parents=True, exist_ok=True)
+        self.spec_hash_path.write_text(spec_hash)
+        self.spec_changed = True
             
-        return spec_path
+        return self.spec_path
         
-    def build_application(self):
+    def build_application(self, spec_path=None):
         """Build the application using PyInstaller"""
         print("🔨 Building macOS application...")
         
-        spec_path = self.create_enhanced_spec()
+        if spec_path is None:
+            spec_path = self.create_enhanced_spec()
         
-        cmd = [
-            sys.executable, "-m", "PyInstaller",
-            "--clean",
-            "--noconfirm",
-            str(spec_path)
-        ]
+        inputs_hash = self.build_inputs_hash(spec_path)
+        inputs_hash_path = self.build_dir / ".inputs_hash"
+        inputs_changed = (not inputs_hash_path.exists()
+                          or inputs_hash_path.read_text().strip() != inputs_hash)
+        
+        cmd = [sys.executable, "-m", "PyInstaller"]
+        if self.spec_changed or inputs_changed:
+            cmd.append("--clean")
+        cmd += ["--noconfirm", str(spec_path)]
         
         result = subprocess.run(cmd, cwd=self.project_root)
         if result.returncode != 0:
             print("❌ PyInstaller build failed")
             sys.exit(1)
             
+        # Only record inputs once they have produced a good build/ cache
+        inputs_hash_path.write_text(inputs_hash)
         print("✅ Application built successfully")
         
+    def build_inputs_hash(self, spec_path):
+        """Hash mtime and size of the files whose changes invalidate PyInstaller's cache"""
+        digest = hashlib.blake2b()
+        for path in (self.project_root / "main.py", Path(spec_path),
+                     self.project_root / "requirements.txt"):
+            if path.exists():
+                stat = path.stat()
+                digest.update(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+        return digest.hexdigest()
+        
+    def convert_info_plist(self):
+        """Rewrite the bundle's XML Info.plist in binary form (must run before signing)"""
+        plist_path = self.dist_dir / "GoLive Studio.app" / "Contents" / "Info.plist"
+        if not plist_path.exists():
+            return
+            
+        with open(plist_path, 'rb') as f:
+            info = plistlib.load(f)
+        plist_path.write_bytes(plistlib.dumps(info, fmt=plistlib.FMT_BINARY))
+        
     def sign_application(self):
         """Code sign the application"""
         print("✍️ Code signing application...")
@@ -297,9 +438,29 @@ app = BUNDLE(
             return
             
         try:
-            # Ad-hoc signing (for development)
-            cmd = ["codesign", "--force", "--deep", "--sign", "-", str(app_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Sign inside-out instead of a serial --deep walk: deepest level first, Mach-O
+            # files in parallel and nested bundles (sealed over their contents, so only
+            # after everything below them) as bundles
+            by_depth = {}
+            for root, dirs, files in os.walk(app_path, topdown=False):
+                depth = root.count(os.sep)
+                for name in files:
+                    path = os.path.join(root, name)
+                    if not os.path.islink(path) and self.is_macho(path):
+                        by_depth.setdefault(depth, []).append(path)
+                for name in dirs:
+                    path = os.path.join(root, name)
+                    if name.endswith(NESTED_BUNDLE_SUFFIXES) and not os.path.islink(path):
+                        by_depth.setdefault(depth + 1, []).append(path)
+            
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                for depth in sorted(by_depth, reverse=True):
+                    for result in executor.map(self.codesign_adhoc, by_depth[depth]):
+                        if result.returncode != 0:
+                            print(f"⚠️ Nested signing failed: {result.stderr.strip()}")
+                
+            # Ad-hoc signing (for development); the bundle itself is sealed last
+            result = self.codesign_adhoc(app_path)
             
             if result.returncode == 0:
                 print("✅ Application signed successfully")
@@ -310,6 +471,19 @@ app = BUNDLE(
         except Exception as e:
             print(f"⚠️ Code signing error: {e}")
             
+    def is_macho(self, path):
+        """Check the file's magic number for a thin or universal Mach-O binary"""
+        try:
+            with open(path, 'rb') as f:
+                return f.read(4) in MACHO_MAGICS
+        except OSError:
+            return False
+            
+    def codesign_adhoc(self, path):
+        """Ad-hoc sign one file or bundle"""
+        cmd = ["codesign", "--force", "--sign", "-", "--timestamp=none", str(path)]
+        return subprocess.run(cmd, capture_output=True, text=True)
+        
     def create_installer_script(self):
         """Create installer script for the DMG"""
         installer_script = '''#!/bin/bash
@@ -378,6 +552,72 @@ echo "You can now launch GoLive Studio from your Applications folder"
         # In a real implementation, you'd use PIL or similar to create an image
         pass
         
+    def clone_path(self, src, dst):
+        """Copy-on-write clone src to dst with clonefile(2); False if unsupported"""
+        if sys.platform != 'darwin':
+            return False
+            
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            clonefile = libc.clonefile
+        except (OSError, AttributeError):
+            return False
+            
+        clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+        clonefile.restype = ctypes.c_int
+        
+        # clonefile is recursive for directories; non-APFS volumes fail with ENOTSUP
+        if clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            print(f"⚠️ clonefile unavailable ({os.strerror(err)}), falling back to copy")
+            return False
+            
+        return True
+        
+    def stage_app(self, app_src, app_dst):
+        """Place a copy of the .app at app_dst as cheaply as the filesystem allows"""
+        if self.clone_path(app_src, app_dst):
+            return
+            
+        try:
+            # Hard links share the file data, so only directory entries are written
+            shutil.copytree(app_src, app_dst, symlinks=True, copy_function=os.link)
+        except OSError:
+            if app_dst.exists():
+                shutil.rmtree(app_dst)
+            shutil.copytree(app_src, app_dst, symlinks=True)
+            
+    def tree_size(self, path):
+        """Total size in bytes of the files under path, without following symlinks"""
+        total = 0
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += self.tree_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+        return total
+        
+    def human_size(self, num_bytes):
+        """Format a byte count like du -h (e.g. 123.4M)"""
+        size = float(num_bytes)
+        for unit in ("B", "K", "M", "G"):
+            if size < 1024:
+                return f"{size:.1f}{unit}" if unit != "B" else f"{int(size)}B"
+            size /= 1024
+        return f"{size:.1f}T"
+        
+    def dmg_format_args(self):
+        """Pick the DMG compression: LZFSE where supported, otherwise balanced zlib"""
+        release = platform.mac_ver()[0]
+        if release:
+            version = tuple(int(part) for part in release.split('.')[:2])
+            if version >= (10, 11):
+                return ["-format", "ULFO"]
+                
+        # zlib level 6 is roughly 3x faster than 9 for a few percent larger image
+        return ["-format", "UDZO", "-imagekey", "zlib-level=6"]
+        
     def create_dmg(self):
         """Create the DMG installer"""
         print("📀 Creating DMG installer...")
@@ -396,7 +636,7 @@ echo "You can now launch GoLive Studio from your Applications folder"
             return
             
         print("📁 Copying application to staging...")
-        shutil.copytree(app_src, app_dst)
+        self.stage_app(app_src, app_dst)
         
         # Create installer script
         self.create_installer_script()
@@ -410,13 +650,11 @@ echo "You can now launch GoLive Studio from your Applications folder"
         # Copy README if exists
         readme_src = self.project_root / "README.md"
         if readme_src.exists():
-            shutil.copy2(readme_src, self.dmg_staging / "README.txt")
+            shutil.copyfile(readme_src, self.dmg_staging / "README.txt")
             
         # Calculate DMG size
-        size_mb = int(subprocess.check_output(
-            ["du", "-sm", str(self.dmg_staging)], 
-            text=True
-        ).split()[0]) * 2 + 100  # Double size plus buffer
+        staging_mb = -(-self.tree_size(self.dmg_staging) // (1024 * 1024))
+        size_mb = staging_mb * 2 + 100  # Double size plus buffer
         
         # Create DMG
         dmg_name = "GoLive_Studio_Installer.dmg"
@@ -433,8 +671,7 @@ echo "You can now launch GoLive Studio from your Applications folder"
             "-srcfolder", str(self.dmg_staging),
             "-ov",
             "-fs", "HFS+",
-            "-format", "UDZO",
-            "-imagekey", "zlib-level=9",
+            *self.dmg_format_args(),
             "-size", f"{size_mb}m",
             str(dmg_path)
         ]
@@ -443,10 +680,7 @@ echo "You can now launch GoLive Studio from your Applications folder"
         
         if result.returncode == 0:
             # Get final size
-            dmg_size = subprocess.check_output(
-                ["du", "-h", str(dmg_path)], 
-                text=True
-            ).split()[0]
+            dmg_size = self.human_size(dmg_path.stat().st_size)
             
             print(f"✅ DMG created successfully: {dmg_path} ({dmg_size})")
             return dmg_path
@@ -466,10 +700,16 @@ echo "You can now launch GoLive Studio from your Applications folder"
                 print("❌ Application not found for PKG creation")
                 return
                 
+            # Give pkgbuild its own root so it never sees the DMG being written to dist/
+            if self.pkg_staging.exists():
+                shutil.rmtree(self.pkg_staging)
+            self.pkg_staging.mkdir(parents=True)
+            self.stage_app(app_path, self.pkg_staging / app_path.name)
+            
             # Create component package
             cmd = [
                 "pkgbuild",
-                "--root", str(app_path.parent),
+                "--root", str(self.pkg_staging),
                 "--identifier", "com.golivestudio.app",
                 "--version", "1.0.0",
                 "--install-location", "/Applications",
@@ -479,10 +719,7 @@ echo "You can now launch GoLive Studio from your Applications folder"
             result = subprocess.run(cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
-                pkg_size = subprocess.check_output(
-                    ["du", "-h", str(pkg_path)], 
-                    text=True
-                ).split()[0]
+                pkg_size = self.human_size(pkg_path.stat().st_size)
                 print(f"✅ PKG created successfully: {pkg_path} ({pkg_size})")
             else:
                 print(f"⚠️ PKG creation failed: {result.stderr}")
@@ -490,18 +727,51 @@ echo "You can now launch GoLive Studio from your Applications folder"
         except Exception as e:
             print(f"⚠️ PKG creation error: {e}")
             
+    def run_task_graph(self, tasks, max_workers=4):
+        """Run {name: (callable, [deps])} tasks, starting each once its deps finish"""
+        results = {}
+        pending = dict(tasks)
+        running = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                # Submit every task whose dependencies have completed
+                for name, (func, deps) in list(pending.items()):
+                    if all(dep in results for dep in deps):
+                        running[executor.submit(func)] = name
+                        del pending[name]
+                        
+                if not running:
+                    raise RuntimeError(f"Unresolvable build dependencies: {sorted(pending)}")
+                    
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+                    
+        return results
+        
     def build(self):
         """Main build process"""
         print("🚀 Building GoLive Studio macOS Installer...")
         print("=" * 50)
         
         self.setup_directories()
-        self.download_ffmpeg_macos()
-        self.build_application()
+        
+        # FFmpeg download and spec generation are independent; PyInstaller needs both
+        self.run_task_graph({
+            'ffmpeg': (self.download_ffmpeg_macos, []),
+            'spec': (self.create_enhanced_spec, []),
+            'build': (partial(self.build_application, self.spec_path), ['ffmpeg', 'spec']),
+        })
+        self.convert_info_plist()
         self.sign_application()
         
-        dmg_path = self.create_dmg()
-        self.create_pkg_installer()
+        # DMG and PKG only read the signed .app, and both spend their time in subprocesses
+        packages = self.run_task_graph({
+            'dmg': (self.create_dmg, []),
+            'pkg': (self.create_pkg_installer, []),
+        }, max_workers=2)
+        dmg_path = packages['dmg']
         
         print("\n🎉 macOS build complete!")
         print("=" * 50)
@@ -514,5 +784,6 @@ echo "You can now launch GoLive Studio from your Applications folder"
         print("✅ Ready for distribution!")
 
 if __name__ == "__main__":
-    builder = MacOSInstallerBuilder()
-    builder.build()
+    # --no-cache always downloads FFmpeg instead of using ~/.cache (for CI)
+    builder = MacOSInstallerBuilder(use_cache="--no-cache" not in sys.argv[1:])
+    builder.build()
\ No newline at end of file
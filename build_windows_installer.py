@@ -4,14 +4,80 @@ Windows Installer Builder for GoLive Studio
 Creates a proper Windows installer with local installation and FFmpeg bundling
 """
 
+import io
 import os
 import sys
 import subprocess
 import shutil
 import requests
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+class RangeHTTPFile(io.RawIOBase):
+    """Read-only, seekable view of a remote file backed by HTTP Range requests"""
+    
+    def __init__(self, url, session=None):
+        super().__init__()
+        self.session = session or requests.Session()
+        
+        head = self.session.head(url, allow_redirects=True, timeout=30)
+        head.raise_for_status()
+        if (head.headers.get("Accept-Ranges", "").lower() != "bytes"
+                or "Content-Length" not in head.headers):
+            raise OSError("server does not support byte ranges")
+            
+        # Range requests go straight to the final URL instead of re-following redirects
+        self.url = head.url
+        self.size = int(head.headers["Content-Length"])
+        self.position = 0
+        
+    def readable(self):
+        return True
+        
+    def seekable(self):
+        return True
+        
+    def tell(self):
+        return self.position
+        
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+            
+        if position < 0:
+            raise ValueError("negative seek position")
+        self.position = position
+        return position
+        
+    def readinto(self, buffer):
+        if self.position >= self.size:
+            return 0
+            
+        end = min(self.position + len(buffer), self.size) - 1
+        response = self.session.get(
+            self.url, headers={"Range": f"bytes={self.position}-{end}"}, timeout=60
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise OSError("server ignored the Range header")
+            
+        data = response.content
+        buffer[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+        
+    def close(self):
+        if not self.closed:
+            self.session.close()
+        super().close()
+
 class WindowsInstallerBuilder:
     def __init__(self):
         self.project_root = Path(__file__).parent
@@ -38,32 +104,31 @@ class WindowsInstallerBuilder:
         # FFmpeg download URL (using a reliable source)
         ffmpeg_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
         
+        # The zip's central directory is at the end, so ranged reads fetch only ffmpeg.exe
         try:
-            print("⬇️ Downloading FFmpeg...")
-            response = requests.get(ffmpeg_url, stream=True)
-            response.raise_for_status()
+            print("⬇️ Fetching ffmpeg.exe from the remote archive...")
+            with RangeHTTPFile(ffmpeg_url) as remote:
+                with io.BufferedReader(remote, buffer_size=4 * 1024 * 1024) as reader:
+                    with zipfile.ZipFile(reader, 'r') as zip_ref:
+                        self.extract_ffmpeg_member(zip_ref, ffmpeg_exe)
+            print("✅ FFmpeg downloaded and extracted")
+            return
+        except (OSError, requests.RequestException, zipfile.BadZipFile) as e:
+            print(f"⚠️ Ranged download unavailable ({e}), downloading full archive")
+            if ffmpeg_exe.exists():
+                ffmpeg_exe.unlink()
             
+        try:
+            print("⬇️ Downloading FFmpeg...")
             zip_path = self.build_dir / "ffmpeg.zip"
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self.download_file(ffmpeg_url, zip_path)
                     
             print("📂 Extracting FFmpeg...")
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.build_dir)
-                
-            # Find and move ffmpeg.exe
-            for root, dirs, files in os.walk(self.build_dir):
-                if "ffmpeg.exe" in files:
-                    src = Path(root) / "ffmpeg.exe"
-                    shutil.copy2(src, ffmpeg_exe)
-                    break
+                self.extract_ffmpeg_member(zip_ref, ffmpeg_exe)
                     
             # Cleanup
             zip_path.unlink()
-            for item in self.build_dir.iterdir():
-                if item.is_dir() and "ffmpeg" in item.name.lower() and item != self.ffmpeg_dir:
-                    shutil.rmtree(item)
                     
             print("✅ FFmpeg downloaded and extracted")
             
@@ -71,6 +136,60 @@ class WindowsInstallerBuilder:
             print(f"❌ Failed to download FFmpeg: {e}")
             sys.exit(1)
             
+    def download_file(self, url, dest_path, connections=8):
+        """Download url to dest_path over parallel byte ranges when the server allows it"""
+        # Byte ranges address the raw entity, so ask for it unencoded throughout
+        head = requests.head(url, headers={"Accept-Encoding": "identity"},
+                             allow_redirects=True, timeout=30)
+        head.raise_for_status()
+        size = int(head.headers.get("Content-Length", 0))
+        
+        if head.headers.get("Accept-Ranges", "").lower() != "bytes" or size < connections * 1024 * 1024:
+            with requests.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(dest_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+            return
+            
+        # Preallocate, then let each connection write its own slice through its own handle
+        with open(dest_path, 'wb') as f:
+            f.truncate(size)
+            
+        part_size = -(-size // connections)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        
+        def fetch_range(byte_range):
+            start, end = byte_range
+            headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+            with requests.get(head.url, headers=headers, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise OSError("server ignored the Range header")
+                copied = 0
+                with open(dest_path, 'r+b') as f:
+                    f.seek(start)
+                    for block in iter(lambda: response.raw.read(1024 * 1024), b""):
+                        f.write(block)
+                        copied += len(block)
+                        
+            # A short 206 would otherwise leave a zero-filled gap in the preallocated file
+            if copied != end - start + 1:
+                raise OSError(f"range {start}-{end} returned {copied} of {end - start + 1} bytes")
+                        
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(fetch_range, ranges))
+            
+    def extract_ffmpeg_member(self, zip_ref, ffmpeg_exe):
+        """Stream only ffmpeg.exe out of the archive, skipping docs, presets and DLLs"""
+        for info in zip_ref.infolist():
+            if info.filename.rsplit('/', 1)[-1] == "ffmpeg.exe":
+                with zip_ref.open(info) as src, open(ffmpeg_exe, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
+                return
+                
+        raise FileNotFoundError("ffmpeg.exe not found in FFmpeg archive")
+        
     def create_pyinstaller_spec(self):
         """Create enhanced PyInstaller spec for Windows"""
         print("📝 Creating PyInstaller spec...")
@@ -274,6 +393,11 @@ InstallDir "$PROGRAMFILES64\\${APP_NAME}"
 InstallDirRegKey HKLM "Software\\${APP_NAME}" "InstallDir"
 RequestExecutionLevel admin
 
+; Compression: one solid LZMA block over the whole payload; PyInstaller output
+; is thousands of similar DLLs and .pyd files, which compress far better together
+SetCompressor /SOLID /FINAL lzma
+SetCompressorDictSize 64
+
 ; Modern UI
 !include "MUI2.nsh"
 
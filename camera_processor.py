@@ -5,38 +5,198 @@ Camera Processor - Functional Implementation
 Applies camera settings like brightness, contrast, saturation, and chroma key to video frames
 """
 
+from __future__ import annotations
+
 from PyQt6.QtGui import QImage, QColor
 from PyQt6.QtCore import Qt
 from typing import Dict, Optional, Tuple
+import math
+
+# numpy, cv2, numba and camera_kernel are imported on first use so that starting the
+# app without camera effects does not pay for them; the *_AVAILABLE flags stay None until then
+np = None
+cv2 = None
+camera_kernel = None
+NUMPY_AVAILABLE = None
+CV2_AVAILABLE = None
+NUMBA_AVAILABLE = None
+KERNEL_AVAILABLE = None
+_adjust_kernel = None
+
+# (brightness, contrast, saturation) -> (bc_lut, sat_matrix), shared by all processors;
+# the tables are read-only once built. Cleared when full, as slider drags add entries.
+_TABLE_CACHE: Dict[Tuple[int, int, int], tuple] = {}
+_TABLE_CACHE_SIZE = 64
+
+
+def _build_adjust_kernel(njit, prange):
+    """Compile the fused brightness, contrast and saturation pass with Numba."""
+    @njit(parallel=True, fastmath=True, cache=True)
+    def adjust_kernel(src, dst, brightness, contrast_factor, sat_factor):
+        """Fused brightness, contrast and saturation pass over an RGB uint8 frame."""
+        height, width = src.shape[0], src.shape[1]
+        for y in prange(height):
+            for x in range(width):
+                r = (src[y, x, 0] + brightness * 0.5 - 128.0) * contrast_factor + 128.0
+                g = (src[y, x, 1] + brightness * 0.5 - 128.0) * contrast_factor + 128.0
+                b = (src[y, x, 2] + brightness * 0.5 - 128.0) * contrast_factor + 128.0
+                if sat_factor < 1.0:
+                    gray = 0.299 * r + 0.587 * g + 0.114 * b
+                    r = gray + (r - gray) * sat_factor
+                    g = gray + (g - gray) * sat_factor
+                    b = gray + (b - gray) * sat_factor
+                else:
+                    r *= sat_factor
+                    g *= sat_factor
+                    b *= sat_factor
+                dst[y, x, 0] = min(255, max(0, int(r)))
+                dst[y, x, 1] = min(255, max(0, int(g)))
+                dst[y, x, 2] = min(255, max(0, int(b)))
+
+    # Compile up front so the first processed frame does not pay for it
+    adjust_kernel(np.zeros((2, 2, 3), np.uint8), np.zeros((2, 2, 3), np.uint8), 0.0, 1.0, 1.0)
+    return adjust_kernel
+
 
-# Try to import numpy and cv2, but gracefully handle if not available
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
-    print("Warning: numpy not available, camera processing will be limited")
+def _lazy_imports():
+    """Import numpy/cv2/numba/camera_kernel once, gracefully handling any that are not available."""
+    global np, cv2, camera_kernel, NUMPY_AVAILABLE, CV2_AVAILABLE, NUMBA_AVAILABLE
+    global KERNEL_AVAILABLE, _adjust_kernel
+    if NUMPY_AVAILABLE is not None:
+        return
+    
+    try:
+        import numpy
+        np = numpy
+        NUMPY_AVAILABLE = True
+    except ImportError:
+        NUMPY_AVAILABLE = False
+        print("Warning: numpy not available, camera processing will be limited")
+    
+    try:
+        import cv2 as cv2_module
+        cv2 = cv2_module
+        CV2_AVAILABLE = True
+    except ImportError:
+        CV2_AVAILABLE = False
+        print("Warning: opencv not available, some camera effects may not work")
+    
+    # Numba is optional; it only accelerates the picture adjustments when OpenCV is missing
+    NUMBA_AVAILABLE = False
+    if NUMPY_AVAILABLE and not CV2_AVAILABLE:
+        try:
+            from numba import njit, prange
+            _adjust_kernel = _build_adjust_kernel(njit, prange)
+            NUMBA_AVAILABLE = True
+        except ImportError:
+            pass
+    
+    # The compiled kernel (build_camera_kernel.py) fuses adjustments and chroma key
+    KERNEL_AVAILABLE = False
+    if NUMPY_AVAILABLE:
+        try:
+            import camera_kernel as kernel_module
+            camera_kernel = kernel_module
+            KERNEL_AVAILABLE = True
+        except ImportError:
+            pass
 
-try:
-    import cv2
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
-    print("Warning: opencv not available, some camera effects may not work")
+def _build_tables(brightness, contrast, saturation):
+    """Build the brightness/contrast LUT or the combined adjustment matrix, or None for each that is unused."""
+    bc_lut = None
+    sat_matrix = None
+    
+    # Brightness then contrast is one affine map per channel: value * scale + offset
+    bc_scale = 1.0 + (contrast / 100.0)
+    bc_offset = (brightness * 0.5 - 128) * bc_scale + 128
+    
+    if saturation != 0:
+        # Saturation is linear in RGB, so it folds into one 3x3 colour matrix
+        sat_factor = max(0.0, min(2.0, 1.0 + (saturation / 100.0)))
+        sat = np.eye(3, dtype=np.float32) * sat_factor
+        if sat_factor < 1.0:
+            # Desaturate by blending towards the luma of each pixel
+            sat += (1.0 - sat_factor) * np.tile(
+                np.array([0.299, 0.587, 0.114], dtype=np.float32), (3, 1))
+        
+        # Brightness/contrast must not clamp before saturation, so fold all three into
+        # one 3x4 affine matrix that cv2.transform evaluates in float and clamps once
+        sat_matrix = np.hstack([sat * bc_scale, sat.sum(axis=1, keepdims=True) * bc_offset])
+    elif brightness != 0 or contrast != 0:
+        # Without saturation, brightness and contrast fold into one 256-entry table
+        values = np.arange(256, dtype=np.float32) * bc_scale + bc_offset
+        bc_lut = np.clip(values, 0, 255).astype(np.uint8)
+    
+    return bc_lut, sat_matrix
 
 class CameraProcessor:
     """Processes camera frames with brightness, contrast, saturation, and chroma key effects."""
     
+    # Read on every frame; slots skip the per-instance __dict__ lookup
+    __slots__ = (
+        'current_settings', '_enabled',
+        '_bc_lut', '_sat_matrix', '_chroma_key', '_chroma_threshold_sq',
+        '_scratch', '_flip_scratch', '_rot_scratch', '_result_buffer',
+    )
+    
     def __init__(self):
         self.current_settings: Optional[Dict] = None
+        self._enabled = False
+        self._bc_lut = None
+        self._sat_matrix = None
+        self._chroma_key = None
+        self._chroma_threshold_sq = 0.0
+        self._scratch = None
+        self._flip_scratch = None
+        self._rot_scratch = None
+        self._result_buffer = None
     
     def update_settings(self, settings: Dict):
         """Update camera processing settings."""
         self.current_settings = settings
+        _lazy_imports()
+        self._enabled = self._compute_enabled()
+        self._build_luts()
         print(f"✅ Camera processor updated with settings: {settings}")
     
+    def _build_luts(self):
+        """Precompute the per-pixel tables and constants for the current settings."""
+        self._bc_lut = None
+        self._sat_matrix = None
+        self._chroma_key = None
+        if not NUMPY_AVAILABLE or not self.current_settings:
+            return
+        
+        brightness = self.current_settings.get('brightness', 0)
+        contrast = self.current_settings.get('contrast', 0)
+        saturation = self.current_settings.get('saturation', 0)
+        
+        # Inputs with the same adjustments (usually all defaults) share one set of tables
+        key = (brightness, contrast, saturation)
+        tables = _TABLE_CACHE.get(key)
+        if tables is None:
+            if len(_TABLE_CACHE) >= _TABLE_CACHE_SIZE:
+                _TABLE_CACHE.clear()
+            tables = _TABLE_CACHE[key] = _build_tables(brightness, contrast, saturation)
+        self._bc_lut, self._sat_matrix = tables
+        
+        # Chroma key colour and squared distance threshold
+        chroma_color = self.current_settings.get('chroma_color', 'Green')
+        threshold = self.current_settings.get('chroma_threshold', 30) / 100.0
+        if chroma_color == 'Blue':
+            self._chroma_key = np.array([0, 0, 255], dtype=np.int16)  # Pure blue
+        else:
+            # Green, and custom colours until they are supported
+            self._chroma_key = np.array([0, 255, 0], dtype=np.int16)  # Pure green
+        # distance / (255 * sqrt(3)) < threshold  <=>  distance^2 < (threshold * 255)^2 * 3
+        self._chroma_threshold_sq = (threshold * 255.0) ** 2 * 3
+    
     def process_frame(self, frame: QImage) -> QImage:
-        """Process camera frame with current settings."""
+        """Process camera frame with current settings.
+        
+        The returned image borrows this processor's frame buffer and is only
+        valid until the next call; copy it to keep it longer.
+        """
         if frame is None or frame.isNull():
             return frame
             
@@ -44,6 +204,8 @@ class CameraProcessor:
         if not self.current_settings or not self.is_enabled():
             return frame
         
+        _lazy_imports()
+        
         # If numpy is not available, only apply basic Qt-based transforms
         if not NUMPY_AVAILABLE:
             return self._apply_qt_transforms(frame)
@@ -57,31 +219,35 @@ class CameraProcessor:
             rgb_frame = frame.convertToFormat(QImage.Format.Format_RGB888)
             ptr = rgb_frame.constBits()
             
-            # Calculate expected size and validate
-            expected_size = height * width * 3
-            ptr.setsize(expected_size)
-            
-            # Create numpy array with proper validation
-            arr = np.frombuffer(ptr, dtype=np.uint8)
-            
-            # Validate array size before reshaping
-            if arr.size != expected_size:
-                print(f"Warning: Array size mismatch. Expected {expected_size}, got {arr.size}")
-                return frame  # Return original if size doesn't match
-            
-            arr = arr.reshape(height, width, 3)
+            # Qt pads each row to 4 bytes, so view whole rows and drop the padding
+            bytes_per_line = rgb_frame.bytesPerLine()
+            ptr.setsize(bytes_per_line * height)
+            arr = np.frombuffer(ptr, dtype=np.uint8).reshape(height, bytes_per_line)
+            arr = arr[:, :width * 3].reshape(height, width, 3)
             
-            # Apply picture adjustments
-            processed = self._apply_picture_adjustments(arr.copy())
+            # Work in a reused scratch buffer instead of allocating a copy per frame
+            if self._scratch is None or self._scratch.shape != arr.shape:
+                self._scratch = np.empty_like(arr)
+            np.copyto(self._scratch, arr)
             
-            # Apply chroma key if enabled
-            if self.current_settings.get('chroma_key_enabled', False):
-                processed = self._apply_chroma_key(processed)
+            if KERNEL_AVAILABLE:
+                # Adjustments and chroma key in one compiled pass, in place
+                processed = self._apply_kernel(self._scratch)
+            else:
+                # Apply picture adjustments
+                processed = self._apply_picture_adjustments(self._scratch)
+                
+                # Apply chroma key if enabled
+                if self.current_settings.get('chroma_key_enabled', False):
+                    processed = self._apply_chroma_key(processed)
             
             # Apply transforms (flip, rotation)
             processed = self._apply_transforms(processed)
             
-            # Convert back to QImage
+            # Convert back to QImage; it wraps the buffer without copying, so keep
+            # the buffer referenced until the next frame replaces it
+            processed = np.ascontiguousarray(processed)
+            self._result_buffer = processed
             h, w, ch = processed.shape
             bytes_per_line = ch * w
             result_image = QImage(processed.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
@@ -92,13 +258,45 @@ class CameraProcessor:
             print(f"Camera processing error: {e}")
             return frame  # Return original frame if processing fails
     
+    def _apply_kernel(self, frame: np.ndarray) -> np.ndarray:
+        """Run the compiled adjustment and chroma key pass over the frame."""
+        brightness = self.current_settings.get('brightness', 0)
+        contrast = self.current_settings.get('contrast', 0)
+        saturation = self.current_settings.get('saturation', 0)
+        sat_factor = max(0.0, min(2.0, 1.0 + (saturation / 100.0)))
+        
+        # Integer distances compare the same against the rounded-up threshold
+        thr_sq = 0
+        if self.current_settings.get('chroma_key_enabled', False):
+            thr_sq = math.ceil(self._chroma_threshold_sq)
+        key_r, key_g, key_b = (int(c) for c in self._chroma_key)
+        
+        camera_kernel.process(frame, float(brightness), 1.0 + (contrast / 100.0),
+                              sat_factor, key_r, key_g, key_b, thr_sq)
+        return frame
+    
     def _apply_picture_adjustments(self, frame: np.ndarray) -> np.ndarray:
         """Apply brightness, contrast, and saturation adjustments."""
+        # Table lookups stay in uint8, avoiding full-frame float32 temporaries
+        if CV2_AVAILABLE:
+            if self._bc_lut is not None:
+                frame = cv2.LUT(frame, self._bc_lut, dst=frame)
+            if self._sat_matrix is not None:
+                # Brightness, contrast and saturation together; see _build_tables
+                frame = cv2.transform(frame, self._sat_matrix)
+            return frame
+        
         # Get adjustment values (-100 to +100)
         brightness = self.current_settings.get('brightness', 0)
         contrast = self.current_settings.get('contrast', 0)
         saturation = self.current_settings.get('saturation', 0)
         
+        if NUMBA_AVAILABLE:
+            # One JIT pass per frame, in place; each pixel is read before it is written
+            sat_factor = max(0.0, min(2.0, 1.0 + (saturation / 100.0)))
+            _adjust_kernel(frame, frame, float(brightness), 1.0 + (contrast / 100.0), sat_factor)
+            return frame
+        
         # Convert to float for processing
         frame = frame.astype(np.float32)
         
@@ -129,7 +327,8 @@ class CameraProcessor:
             
             # Simple saturation adjustment by blending with grayscale
             gray = np.dot(frame_norm, [0.299, 0.587, 0.114])
-            gray = np.stack([gray, gray, gray], axis=-1)
+            # (H, W, 1) broadcasts against (H, W, 3) without a stacked copy
+            gray = gray[..., np.newaxis]
             
             # Saturation factor (-100 to +100 -> 0.0 to 2.0)
             sat_factor = 1.0 + (saturation / 100.0)
@@ -154,30 +353,14 @@ class CameraProcessor:
     def _apply_chroma_key(self, frame: np.ndarray) -> np.ndarray:
         """Apply chroma key (green screen) effect."""
         try:
-            chroma_color = self.current_settings.get('chroma_color', 'Green')
-            threshold = self.current_settings.get('chroma_threshold', 30) / 100.0
-            
-            # Define chroma key colors
-            if chroma_color == 'Green':
-                key_color = np.array([0, 255, 0])  # Pure green
-            elif chroma_color == 'Blue':
-                key_color = np.array([0, 0, 255])  # Pure blue
-            else:
-                # Custom color - use green as default
-                key_color = np.array([0, 255, 0])
-            
-            # Calculate color distance
-            diff = np.abs(frame.astype(np.float32) - key_color.astype(np.float32))
-            distance = np.sqrt(np.sum(diff ** 2, axis=2)) / (255.0 * np.sqrt(3))
-            
-            # Create alpha mask
-            alpha = np.where(distance < threshold, 0, 255).astype(np.uint8)
+            # Compare squared distances, skipping the per-pixel sqrt and normalise
+            diff = np.abs(frame.astype(np.int16) - self._chroma_key)
+            distance_sq = np.einsum('ijk,ijk->ij', diff, diff, dtype=np.int32)
             
-            # Apply transparency by making chroma key areas black
-            mask = alpha[:, :, np.newaxis] / 255.0
-            result = frame * mask
+            # Make chroma key areas black (frame is already a private copy)
+            frame[distance_sq < self._chroma_threshold_sq] = 0
             
-            return result.astype(np.uint8)
+            return frame
             
         except Exception as e:
             print(f"Chroma key error: {e}")
@@ -186,6 +369,9 @@ class CameraProcessor:
     def _apply_transforms(self, frame: np.ndarray) -> np.ndarray:
         """Apply flip and rotation transforms."""
         try:
+            if CV2_AVAILABLE:
+                return self._apply_cv2_transforms(frame)
+            
             # Flip horizontal
             if self.current_settings.get('flip_horizontal', False):
                 frame = np.fliplr(frame)
@@ -209,8 +395,38 @@ class CameraProcessor:
             print(f"Transform error: {e}")
             return frame
     
+    def _apply_cv2_transforms(self, frame: np.ndarray) -> np.ndarray:
+        """Flip and rotate with OpenCV into reused, contiguous buffers."""
+        flip_h = self.current_settings.get('flip_horizontal', False)
+        flip_v = self.current_settings.get('flip_vertical', False)
+        if flip_h or flip_v:
+            flip_code = -1 if (flip_h and flip_v) else (1 if flip_h else 0)
+            if self._flip_scratch is None or self._flip_scratch.shape != frame.shape:
+                self._flip_scratch = np.empty_like(frame)
+            frame = cv2.flip(frame, flip_code, dst=self._flip_scratch)
+        
+        rotation = self.current_settings.get('rotation', 0)
+        rotate_code = {
+            90: cv2.ROTATE_90_CLOCKWISE,
+            180: cv2.ROTATE_180,
+            270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+        }.get(rotation)
+        if rotate_code is not None:
+            h, w, ch = frame.shape
+            shape = (h, w, ch) if rotation == 180 else (w, h, ch)
+            if self._rot_scratch is None or self._rot_scratch.shape != shape:
+                self._rot_scratch = np.empty(shape, dtype=frame.dtype)
+            frame = cv2.rotate(frame, rotate_code, dst=self._rot_scratch)
+        
+        return frame
+    
     def is_enabled(self) -> bool:
         """Check if any processing is enabled."""
+        # Settings only change through update_settings, so this is answered there
+        return self._enabled
+    
+    def _compute_enabled(self) -> bool:
+        """Work out whether the current settings enable any processing."""
         if not self.current_settings:
             return False
         
@@ -7,8 +7,23 @@ Handles application settings and configuration
 
 import os
 import json
+from functools import lru_cache
 from pathlib import Path
 
+# orjson is optional; it encodes settings in C, several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@lru_cache(maxsize=512)
+def _split_key_path(key_path):
+    """Split a dotted settings path once; hot paths ask for the same keys every frame"""
+    return tuple(key_path.split('.'))
+
+
 class Config:
     """Application configuration management"""
     
@@ -74,8 +89,11 @@ class Config:
         """Load settings from config file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
+                if ORJSON_AVAILABLE:
+                    loaded_settings = orjson.loads(self.config_file.read_bytes())
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        loaded_settings = json.load(f)
                 # Merge with defaults to ensure all keys exist
                 settings = self.default_settings.copy()
                 self._deep_update(settings, loaded_settings)
@@ -89,8 +107,19 @@ class Config:
     def save_settings(self):
         """Save current settings to config file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            # Write a temp file and swap it in, so a crash mid-save never truncates config.json
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            if ORJSON_AVAILABLE:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.settings, option=orjson.OPT_INDENT_2))
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.settings, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
             return True
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -98,7 +127,7 @@ class Config:
     
     def get(self, key_path, default=None):
         """Get setting value using dot notation (e.g., 'window.width')"""
-        keys = key_path.split('.')
+        keys = _split_key_path(key_path)
         value = self.settings
         
         try:
@@ -110,7 +139,7 @@ class Config:
     
     def set(self, key_path, value):
         """Set setting value using dot notation"""
-        keys = key_path.split('.')
+        keys = _split_key_path(key_path)
         setting = self.settings
         
         # Navigate to the parent of the target key
@@ -123,12 +152,15 @@ class Config:
         setting[keys[-1]] = value
     
     def _deep_update(self, base_dict, update_dict):
-        """Recursively update nested dictionary"""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        """Update nested dictionary in place, walking levels with an explicit stack"""
+        stack = [(base_dict, update_dict)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                if key in base and isinstance(base[key], dict) and isinstance(value, dict):
+                    stack.append((base[key], value))
+                else:
+                    base[key] = value
     
     def reset_to_defaults(self):
         """Reset all settings to default values"""
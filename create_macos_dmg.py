@@ -7,13 +7,195 @@ Creates a beautiful, professional DMG with proper layout and branding
 
 import os
 import sys
+import hashlib
+import mmap
+import platform
 import subprocess
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 import plistlib
 import json
 
+# PyObjC is optional; it runs AppleScript in-process instead of spawning osascript
+try:
+    from Foundation import NSAppleScript
+    PYOBJC_AVAILABLE = True
+except ImportError:
+    PYOBJC_AVAILABLE = False
+
+# ds_store (installed with dmgbuild) writes the Finder layout without mounting the image
+try:
+    from ds_store import DSStore
+    DS_STORE_AVAILABLE = True
+except ImportError:
+    DS_STORE_AVAILABLE = False
+
+# blake3 is optional; its SIMD hashing makes the unchanged-bundle check nearly free
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+MACHO_MAGICS = {
+    bytes.fromhex('feedface'), bytes.fromhex('cefaedfe'),
+    bytes.fromhex('feedfacf'), bytes.fromhex('cffaedfe'),
+    bytes.fromhex('cafebabe'), bytes.fromhex('bebafeca'),
+}
+
+# Files per codesign invocation; amortizes process spawn without serializing everything
+CODESIGN_BATCH_SIZE = 50
+
+# Bundles nested in the .app that carry their own signature
+NESTED_BUNDLE_SUFFIXES = ('.framework', '.app', '.appex', '.bundle', '.plugin', '.xpc')
+
+# Intermediate images larger than this are staged on disk rather than in RAM
+RAM_DISK_MAX_BYTES = 2 * 1024 ** 3
+RAM_DISK_SLACK_BYTES = 64 * 1024 ** 2
+
+
+def fast_copytree(src, dst):
+    """Copy an .app bundle to dst, cloning on APFS and falling back to ditto, tar, then copytree."""
+    src, dst = Path(src), Path(dst)
+    
+    # cp -c clones each file with clonefile(2), so on APFS no file data is copied;
+    # ditto keeps symlinks, xattrs and resource forks on other filesystems
+    for cmd in (['cp', '-cR', str(src), str(dst)], ['ditto', '--rsrc', str(src), str(dst)]):
+        try:
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            if dst.exists():
+                shutil.rmtree(dst)
+    
+    # tar | tar reads the tree once and streams it through a pipe, with no
+    # per-file work in Python; symlinks and permissions are kept
+    try:
+        dst.mkdir(parents=True)
+        reader = subprocess.Popen(['tar', 'cf', '-', '-C', str(src), '.'],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            subprocess.run(['tar', 'xf', '-', '-C', str(dst)], stdin=reader.stdout,
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        finally:
+            reader.stdout.close()
+        if reader.wait() == 0:
+            return
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    if dst.exists():
+        shutil.rmtree(dst)
+    
+    # copy skips copy2's per-file utime/chflags; hdiutil stamps its own metadata anyway
+    shutil.copytree(src, dst, symlinks=True, copy_function=shutil.copy)
+
+
+def link_applications(folder):
+    """Add the drag-to-install Applications link to folder, keeping one already there."""
+    # One symlink() call; no exists() stat that would follow the link
+    try:
+        os.symlink('/Applications', os.path.join(folder, 'Applications'))
+    except FileExistsError:
+        pass
+
+
+def tree_size(path):
+    """Total size in bytes of the files under path, without following symlinks."""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += tree_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def has_free_space(app_path, multiplier=3):
+    """Check the temp and output volumes can hold the images built from app_path."""
+    # Source bundle, writable image and compressed image, at worst all on one volume
+    required = tree_size(app_path) * multiplier
+    for directory in {tempfile.gettempdir(), str(Path(app_path).parent)}:
+        free = shutil.disk_usage(directory).free
+        if free < required:
+            print(f"❌ Not enough free space in {directory}: "
+                  f"need {required / (1024 * 1024):.0f} MB, have {free / (1024 * 1024):.0f} MB")
+            return False
+    return True
+
+
+@contextmanager
+def scratch_dir(size_bytes):
+    """Yield a scratch directory on a RAM disk big enough for size_bytes, or a temp dir.
+    
+    The intermediate read-write image is written in full and then read back by
+    hdiutil convert; keeping it in RAM stops that traffic competing with the
+    final DMG write on the boot SSD.
+    """
+    device = None
+    volume_name = f'GoLiveScratch{os.getpid()}'
+    if sys.platform == 'darwin' and size_bytes <= RAM_DISK_MAX_BYTES:
+        sectors = (int(size_bytes * 1.2) + RAM_DISK_SLACK_BYTES) // 512
+        try:
+            device = subprocess.run(
+                ['hdiutil', 'attach', '-nomount', f'ram://{sectors}'],
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+            subprocess.run(['diskutil', 'erasevolume', 'HFS+', volume_name, device],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            if device:
+                subprocess.run(['hdiutil', 'detach', device, '-force'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            device = None
+    
+    if device is None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+        return
+    
+    try:
+        yield Path('/Volumes') / volume_name
+    finally:
+        subprocess.run(['hdiutil', 'detach', device, '-force'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def run_applescript(source, timeout=30):
+    """Run an AppleScript, in-process when PyObjC is available; True on success."""
+    if PYOBJC_AVAILABLE:
+        _, error = NSAppleScript.alloc().initWithSource_(source).executeAndReturnError_(None)
+        return error is None
+    
+    result = subprocess.run(['osascript', '-e', source],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
+    return result.returncode == 0
+
+
+def parse_mount_point(plist_output):
+    """Return the mount point from `hdiutil attach -plist` output, or None."""
+    info = plistlib.loads(plist_output)
+    return next(
+        (entity['mount-point'] for entity in info.get('system-entities', [])
+         if 'mount-point' in entity),
+        None
+    )
+
+
+def dmg_format_args():
+    """Pick the DMG compression: LZFSE where supported, otherwise balanced zlib."""
+    release = platform.mac_ver()[0]
+    if release:
+        version = tuple(int(part) for part in release.split('.')[:2])
+        if version >= (10, 11):
+            return ['-format', 'ULFO']
+    
+    # zlib level 6 is roughly 3x faster than 9 for a few percent larger image
+    return ['-format', 'UDZO', '-imagekey', 'zlib-level=6']
+
 
 class MacOSDMGCreator:
     """Creates professional macOS DMG packages."""
@@ -24,7 +206,45 @@ class MacOSDMGCreator:
         self.app_name = 'GoLive Studio'
         self.app_path = self.dist_dir / f'{self.app_name}.app'
         self.dmg_path = self.dist_dir / f'{self.app_name}.dmg'
+        self.manifest_path = self.dist_dir / '.dmg_manifest.json'
+        
+    def bundle_fingerprint(self):
+        """Hash every path, symlink target and file's contents in the app bundle."""
+        digest = blake3.blake3() if BLAKE3_AVAILABLE else hashlib.blake2b()
+        for root, dirs, files in os.walk(self.app_path):
+            dirs.sort()
+            for name in sorted(files + [d for d in dirs if os.path.islink(os.path.join(root, d))]):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, self.app_path).encode() + b'\0')
+                if os.path.islink(path):
+                    digest.update(os.readlink(path).encode() + b'\0')
+                    continue
+                with open(path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                            digest.update(data)
+                digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def is_dmg_current(self):
+        """Check whether the existing DMG was built from the bundle as it is now."""
+        if not self.dmg_path.exists() or not self.manifest_path.exists():
+            return False
         
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError):
+            return False
+        
+        return manifest.get('fingerprint') == self.bundle_fingerprint()
+    
+    def save_manifest(self):
+        """Record the bundle fingerprint the finished DMG was built from."""
+        # Taken after signing, which rewrites the bundle in place; a rerun on the
+        # same build then sees exactly this state before it signs again
+        manifest = {'fingerprint': self.bundle_fingerprint(), 'dmg': self.dmg_path.name}
+        self.manifest_path.write_text(json.dumps(manifest, indent=2))
+    
     def verify_app_bundle(self):
         """Verify the app bundle exists and is valid."""
         print("🔍 Verifying app bundle...")
@@ -53,16 +273,37 @@ class MacOSDMGCreator:
         print("🔐 Signing app bundle...")
         
         try:
-            # Sign with ad-hoc signature (no developer certificate required)
-            cmd = [
-                'codesign',
-                '--force',
-                '--deep',
-                '--sign', '-',
-                str(self.app_path)
-            ]
+            # Sign inside-out instead of a serial --deep walk: deepest level first, Mach-O
+            # files in parallel batches and nested bundles (sealed over their contents,
+            # so only after everything below them) one per call; the .app is sealed last
+            by_depth = {}
+            for root, dirs, files in os.walk(self.app_path, topdown=False):
+                depth = root.count(os.sep)
+                for name in files:
+                    path = os.path.join(root, name)
+                    if not os.path.islink(path) and self.is_macho(path):
+                        by_depth.setdefault(depth, ([], []))[0].append(path)
+                for name in dirs:
+                    path = os.path.join(root, name)
+                    if name.endswith(NESTED_BUNDLE_SUFFIXES) and not os.path.islink(path):
+                        by_depth.setdefault(depth + 1, ([], []))[1].append(path)
+            
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                for depth in sorted(by_depth, reverse=True):
+                    paths, bundles = by_depth[depth]
+                    batches = [
+                        paths[i:i + CODESIGN_BATCH_SIZE]
+                        for i in range(0, len(paths), CODESIGN_BATCH_SIZE)
+                    ]
+                    batches.extend([bundle] for bundle in bundles)
+                    for result in executor.map(self.codesign_adhoc, batches):
+                        if result.returncode != 0:
+                            print(f"⚠️ Nested signing failed: {result.stderr.strip()}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Sign with ad-hoc signature (no developer certificate required)
+            result = self.codesign_adhoc(
+                [self.app_path], '--preserve-metadata=identifier,entitlements'
+            )
             if result.returncode == 0:
                 print("✅ App bundle signed successfully")
                 return True
@@ -76,6 +317,19 @@ class MacOSDMGCreator:
             print("📝 Continuing without signature")
             return True
     
+    def is_macho(self, path):
+        """Check the file's magic number for a thin or universal Mach-O binary."""
+        try:
+            with open(path, 'rb') as f:
+                return f.read(4) in MACHO_MAGICS
+        except OSError:
+            return False
+    
+    def codesign_adhoc(self, paths, *options):
+        """Ad-hoc sign a batch of files or bundles in one codesign call."""
+        cmd = ['codesign', '--force', '--sign', '-', *options, *[str(path) for path in paths]]
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    
     def create_dmg_background(self):
         """Create a custom DMG background image."""
         print("🎨 Creating DMG background...")
@@ -93,33 +347,53 @@ class MacOSDMGCreator:
             if self.dmg_path.exists():
                 self.dmg_path.unlink()
             
-            # Create temporary directory for DMG contents
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                dmg_contents = temp_path / 'dmg_contents'
-                dmg_contents.mkdir()
-                
-                # Copy app to DMG contents
-                app_in_dmg = dmg_contents / f'{self.app_name}.app'
-                shutil.copytree(self.app_path, app_in_dmg)
-                
-                # Create Applications symlink
-                applications_link = dmg_contents / 'Applications'
-                applications_link.symlink_to('/Applications')
-                
-                # Create DMG
+            # Build straight from the .app; the Applications link is added after mounting
+            with scratch_dir(tree_size(self.app_path)) as temp_path:
+                temp_dmg = temp_path / 'temp.dmg'
                 cmd = [
                     'hdiutil', 'create',
+                    '-srcfolder', str(self.app_path),
                     '-volname', self.app_name,
-                    '-srcfolder', str(dmg_contents),
+                    '-format', 'UDRW',
                     '-ov',
-                    '-format', 'UDZO',
-                    '-imagekey', 'zlib-level=9',
-                    str(self.dmg_path)
+                    str(temp_dmg)
                 ]
                 
                 print(f"🔨 Running: {' '.join(cmd)}")
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, text=True)
+                if result.returncode != 0:
+                    print(f"❌ DMG creation failed: {result.stderr}")
+                    return False
+                
+                mount_result = subprocess.run([
+                    'hdiutil', 'attach', str(temp_dmg), '-readwrite', '-noverify', '-noautoopen',
+                    '-plist'
+                ], capture_output=True, check=True)
+                
+                # Parse mount point
+                mount_point = parse_mount_point(mount_result.stdout)
+                
+                if not mount_point:
+                    raise Exception("Could not determine mount point")
+                
+                try:
+                    # Create Applications symlink
+                    link_applications(mount_point)
+                finally:
+                    subprocess.run(['hdiutil', 'detach', mount_point],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                
+                # Convert to compressed read-only DMG
+                cmd = [
+                    'hdiutil', 'convert', str(temp_dmg),
+                    *dmg_format_args(),
+                    '-ov',
+                    '-o', str(self.dmg_path)
+                ]
+                
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, text=True)
                 
                 if result.returncode == 0:
                     print(f"✅ DMG created successfully: {self.dmg_path}")
@@ -132,45 +406,119 @@ class MacOSDMGCreator:
             print(f"❌ DMG creation error: {e}")
             return False
     
+    def write_ds_store(self, path):
+        """Write the Finder window layout the AppleScript below would produce."""
+        with DSStore.open(str(path), 'w+') as ds:
+            ds['.']['vSrn'] = ('long', 1)
+            ds['.']['bwsp'] = {
+                'WindowBounds': '{{100, 100}, {500, 300}}',
+                'ShowToolbar': False,
+                'ShowStatusBar': False,
+                'ShowSidebar': False,
+                'ShowPathbar': False,
+                'ShowTabView': False,
+                'ContainerShowSidebar': False,
+                'PreviewPaneVisibility': False,
+                'SidebarWidth': 180,
+            }
+            ds['.']['icvp'] = {
+                'viewOptionsVersion': 1,
+                'arrangeBy': 'none',
+                'iconSize': 128.0,
+                'textSize': 12.0,
+                'gridSpacing': 100.0,
+                'gridOffsetX': 0.0,
+                'gridOffsetY': 0.0,
+                'labelOnBottom': True,
+                'showIconPreview': False,
+                'showItemInfo': False,
+                'scrollPositionX': 0.0,
+                'scrollPositionY': 0.0,
+                'backgroundType': 0,
+                'backgroundColorRed': 1.0,
+                'backgroundColorGreen': 1.0,
+                'backgroundColorBlue': 1.0,
+            }
+            ds[f'{self.app_name}.app']['Iloc'] = (150, 200)
+            ds['Applications']['Iloc'] = (350, 200)
+    
+    def create_staged_dmg(self):
+        """Create the final DMG in one hdiutil pass from a pre-laid-out folder."""
+        try:
+            if self.dmg_path.exists():
+                self.dmg_path.unlink()
+            
+            with tempfile.TemporaryDirectory() as temp_dir:
+                dmg_contents = Path(temp_dir) / 'dmg_contents'
+                dmg_contents.mkdir()
+                
+                fast_copytree(self.app_path, dmg_contents / f'{self.app_name}.app')
+                link_applications(dmg_contents)
+                self.write_ds_store(dmg_contents / '.DS_Store')
+                
+                # Compressed straight from the folder: no UDRW image, mount or convert
+                cmd = [
+                    'hdiutil', 'create',
+                    '-srcfolder', str(dmg_contents),
+                    '-volname', self.app_name,
+                    '-fs', 'HFS+',
+                    *dmg_format_args(),
+                    '-ov',
+                    str(self.dmg_path)
+                ]
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            
+            print(f"✅ Professional DMG created: {self.dmg_path}")
+            return True
+            
+        except Exception as e:
+            print(f"⚠️ Single-pass DMG creation failed: {e}")
+            return False
+    
     def create_professional_dmg(self):
         """Create a professional DMG with custom layout."""
         print("🎨 Creating professional DMG...")
         
+        if DS_STORE_AVAILABLE:
+            if self.create_staged_dmg():
+                return True
+            print("🔄 Falling back to Finder layout on a mounted image...")
+        
         try:
             # Remove existing DMG
             if self.dmg_path.exists():
                 self.dmg_path.unlink()
             
+            # Size the writable image from the bundle with room for the layout files,
+            # rather than a fixed 500 MB that is too small for big bundles and otherwise
+            # makes convert compress hundreds of MB of empty space
+            image_mb = int(tree_size(self.app_path) * 1.15 / (1024 * 1024)) + 20
+            
             # Create temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
+            with scratch_dir(image_mb * 1024 * 1024) as temp_path:
                 # Step 1: Create a writable DMG
                 temp_dmg = temp_path / 'temp.dmg'
                 cmd = [
                     'hdiutil', 'create',
-                    '-srcfolder', str(self.app_path.parent),
+                    '-srcfolder', str(self.app_path),
                     '-volname', self.app_name,
                     '-fs', 'HFS+',
                     '-fsargs', '-c c=64,a=16,e=16',
                     '-format', 'UDRW',
-                    '-size', '500m',
+                    '-size', f'{image_mb}m',
                     str(temp_dmg)
                 ]
                 
-                subprocess.run(cmd, check=True, capture_output=True)
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
                 
                 # Step 2: Mount the DMG
                 mount_result = subprocess.run([
-                    'hdiutil', 'attach', str(temp_dmg), '-readwrite', '-noverify', '-noautoopen'
-                ], capture_output=True, text=True, check=True)
+                    'hdiutil', 'attach', str(temp_dmg), '-readwrite', '-noverify', '-noautoopen',
+                    '-plist'
+                ], capture_output=True, check=True)
                 
                 # Parse mount point
-                mount_point = None
-                for line in mount_result.stdout.split('\n'):
-                    if '/Volumes/' in line:
-                        mount_point = line.split('\t')[-1].strip()
-                        break
+                mount_point = parse_mount_point(mount_result.stdout)
                 
                 if not mount_point:
                     raise Exception("Could not determine mount point")
@@ -180,18 +528,15 @@ class MacOSDMGCreator:
                 
                 try:
                     # Step 3: Customize DMG contents
-                    # Remove any existing files
-                    for item in mount_path.iterdir():
-                        if item.name != f'{self.app_name}.app':
-                            if item.is_dir():
-                                shutil.rmtree(item)
-                            else:
-                                item.unlink()
+                    # Remove any existing files; the image only holds the app, so usually none
+                    keep = {f'{self.app_name}.app', 'Applications'}
+                    extras = [str(item) for item in mount_path.iterdir() if item.name not in keep]
+                    if extras:
+                        subprocess.run(['find', *extras, '-delete'],
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     
                     # Create Applications symlink
-                    applications_link = mount_path / 'Applications'
-                    if not applications_link.exists():
-                        applications_link.symlink_to('/Applications')
+                    link_applications(mount_path)
                     
                     # Set custom icon positions (using AppleScript)
                     applescript = f'''
@@ -217,8 +562,8 @@ class MacOSDMGCreator:
                     
                     # Run AppleScript to set layout
                     try:
-                        subprocess.run(['osascript', '-e', applescript], 
-                                     capture_output=True, timeout=30)
+                        if not run_applescript(applescript):
+                            raise RuntimeError("AppleScript failed")
                         print("✅ DMG layout configured")
                     except:
                         print("⚠️ Could not set custom layout (DMG will still work)")
@@ -226,17 +571,16 @@ class MacOSDMGCreator:
                 finally:
                     # Step 4: Unmount the DMG
                     subprocess.run(['hdiutil', 'detach', str(mount_path)], 
-                                 capture_output=True)
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 
                 # Step 5: Convert to compressed read-only DMG
                 cmd = [
                     'hdiutil', 'convert', str(temp_dmg),
-                    '-format', 'UDZO',
-                    '-imagekey', 'zlib-level=9',
+                    *dmg_format_args(),
                     '-o', str(self.dmg_path)
                 ]
                 
-                subprocess.run(cmd, check=True, capture_output=True)
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
                 print(f"✅ Professional DMG created: {self.dmg_path}")
                 return True
                 
@@ -254,23 +598,12 @@ class MacOSDMGCreator:
             return False
         
         try:
-            # Test mount the DMG
+            # Check the image checksums without mounting it
             result = subprocess.run([
-                'hdiutil', 'attach', str(self.dmg_path), '-verify', '-readonly'
-            ], capture_output=True, text=True)
+                'hdiutil', 'verify', str(self.dmg_path)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
             
             if result.returncode == 0:
-                # Find mount point and unmount
-                mount_point = None
-                for line in result.stdout.split('\n'):
-                    if '/Volumes/' in line:
-                        mount_point = line.split('\t')[-1].strip()
-                        break
-                
-                if mount_point:
-                    subprocess.run(['hdiutil', 'detach', mount_point], 
-                                 capture_output=True)
-                
                 # Get DMG size
                 size_mb = self.dmg_path.stat().st_size / (1024 * 1024)
                 print(f"✅ DMG verified successfully ({size_mb:.1f} MB)")
@@ -292,12 +625,23 @@ class MacOSDMGCreator:
         if not self.verify_app_bundle():
             return False
         
-        # Step 2: Sign app bundle
-        if not self.sign_app_bundle():
+        # Skip signing and imaging entirely when the bundle has not changed
+        if self.is_dmg_current():
+            print(f"✅ DMG is up to date with the app bundle: {self.dmg_path}")
+            return True
+        
+        # Fail fast before any signing, copying or image writes
+        if not has_free_space(self.app_path):
             return False
         
-        # Step 3: Create DMG background
-        self.create_dmg_background()
+        # Steps 2 and 3: Sign app bundle while the DMG background is prepared; staging
+        # the bundle itself has to wait, or it would pick up half-signed binaries
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            signed = executor.submit(self.sign_app_bundle)
+            background = executor.submit(self.create_dmg_background)
+            background.result()
+            if not signed.result():
+                return False
         
         # Step 4: Create professional DMG
         if not self.create_professional_dmg():
@@ -307,6 +651,8 @@ class MacOSDMGCreator:
         if not self.verify_dmg():
             return False
         
+        self.save_manifest()
+        
         print(f"\n🎉 DMG creation completed successfully!")
         print(f"📁 DMG location: {self.dmg_path}")
         print(f"📊 DMG size: {self.dmg_path.stat().st_size / (1024 * 1024):.1f} MB")
@@ -4,21 +4,56 @@ Windows EXE Builder for GoLive Studio
 Creates a complete Windows executable installer with all dependencies
 """
 
+import contextlib
 import os
 import sys
 import subprocess
 import shutil
+import hashlib
+import json
 import requests
+from requests.adapters import HTTPAdapter
 import zipfile
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Downloaded FFmpeg archives are kept here between builds, keyed by source URL
+FFMPEG_CACHE_DIR = Path.home() / ".cache" / "golive-build" / "ffmpeg"
+
+# Run in a child interpreter so importing the candidates leaves the builder untouched
+RESOLVE_IMPORTS_SCRIPT = """
+import importlib.util, json, sys
+found = []
+for name in json.load(sys.stdin):
+    try:
+        if importlib.util.find_spec(name) is not None:
+            found.append(name)
+    except Exception:
+        pass
+json.dump(found, sys.stdout)
+"""
+
 class WindowsEXEBuilder:
-    def __init__(self):
+    # Project packages main.py's import graph never reaches. Qt, numpy, cv2, av and the
+    # statically imported project modules are found by analysis and PyInstaller's hooks,
+    # and each package's __init__ pulls in its own submodules
+    hidden_imports = [
+        'encoder',
+        'audio',
+    ]
+    
+    def __init__(self, use_cache=True, rebuild=False):
         self.project_root = Path(__file__).parent
         self.build_dir = self.project_root / "build"
         self.dist_dir = self.project_root / "dist"
         self.windows_dir = self.project_root / "windows_build"
+        self.use_cache = use_cache
+        # One pooled session so the HEAD probe and every range worker reuse warm TLS connections
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=8))
+        self.rebuild = rebuild
         
     def setup_directories(self):
         """Create build directories"""
@@ -43,30 +78,19 @@ class WindowsEXEBuilder:
             ffmpeg_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
             
             print("⬇️ Downloading FFmpeg...")
-            response = requests.get(ffmpeg_url, stream=True)
-            response.raise_for_status()
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    tmp_file.write(chunk)
-                zip_path = tmp_file.name
-            
-            print("📂 Extracting FFmpeg...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                temp_extract = self.build_dir / "temp_ffmpeg"
-                zip_ref.extractall(temp_extract)
-                
-                # Find ffmpeg.exe
-                for root, dirs, files in os.walk(temp_extract):
-                    if "ffmpeg.exe" in files:
-                        src = Path(root) / "ffmpeg.exe"
-                        shutil.copy2(src, ffmpeg_exe)
-                        break
+            with contextlib.ExitStack() as stack:
+                if self.use_cache:
+                    zip_source = self.cached_download(ffmpeg_url)
+                else:
+                    # Uncached, the archive is only read once, so keep it in RAM and let ZipFile seek there
+                    zip_source = stack.enter_context(tempfile.SpooledTemporaryFile(max_size=256 * 1024 * 1024))
+                    self.download_file(ffmpeg_url, zip_source)
+                    zip_source.seek(0)
                 
-                # Cleanup
-                shutil.rmtree(temp_extract)
+                print("📂 Extracting FFmpeg...")
+                with zipfile.ZipFile(zip_source, 'r') as zip_ref:
+                    self.extract_ffmpeg_member(zip_ref, ffmpeg_exe)
             
-            os.unlink(zip_path)
             print("✅ FFmpeg downloaded successfully")
             return str(ffmpeg_exe)
             
@@ -74,19 +98,209 @@ class WindowsEXEBuilder:
             print(f"❌ Failed to download FFmpeg: {e}")
             return None
             
-    def create_windows_pyinstaller_spec(self):
-        """Create PyInstaller spec for Windows EXE"""
+    def extract_ffmpeg_member(self, zip_ref, ffmpeg_exe):
+        """Stream only ffmpeg.exe out of the archive, skipping docs, presets and DLLs"""
+        for info in zip_ref.infolist():
+            # Some Windows zip tools store backslash-separated names
+            if info.filename.replace('\\', '/').rsplit('/', 1)[-1] == "ffmpeg.exe":
+                with zip_ref.open(info) as src, open(ffmpeg_exe, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
+                return
+                
+        raise FileNotFoundError("ffmpeg.exe not found in FFmpeg archive")
+        
+    def cached_download(self, url):
+        """Return a local copy of url's zip, revalidating a cached copy with one conditional GET"""
+        FFMPEG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        key = hashlib.sha256(url.encode()).hexdigest()
+        zip_path = FFMPEG_CACHE_DIR / f"{key}.zip"
+        meta_path = FFMPEG_CACHE_DIR / f"{key}.meta.json"
+        
+        # Validators saved with the cached copy make the GET conditional; a missing or
+        # damaged meta file just means a full download
+        headers = {}
+        if zip_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+                
+        try:
+            response = self.open_download(url, headers)
+        except requests.RequestException:
+            if zip_path.exists():
+                print("⚠️ Could not reach the FFmpeg server, using the cached archive")
+                return zip_path
+            raise
+            
+        with response:
+            if response.status_code == 304:
+                print(f"✅ Using cached FFmpeg archive: {zip_path}")
+                return zip_path
+                
+            # Download next to the cache entry and rename, so an interrupted build never leaves a partial zip
+            partial_path = zip_path.with_suffix(".part")
+            with open(partial_path, "w+b") as f:
+                self.download_file(url, f, response=response)
+            meta = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+            
+        os.replace(partial_path, zip_path)
+        partial_meta_path = meta_path.with_suffix(".part")
+        partial_meta_path.write_text(json.dumps(meta))
+        os.replace(partial_meta_path, meta_path)
+        return zip_path
+        
+    def open_download(self, url, headers=None):
+        """Start a streaming GET of url's raw bytes, which download_file can continue from"""
+        # Byte ranges address the raw entity, so ask for it unencoded throughout
+        response = self.session.get(url, headers={"Accept-Encoding": "identity", **(headers or {})},
+                                    stream=True, timeout=60)
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            response.close()
+            raise
+        return response
+        
+    def download_file(self, url, dest, connections=8, response=None):
+        """Download url into the seekable file object dest, over parallel byte ranges when the server allows it
+        
+        response is an already-open GET from open_download; its headers decide the strategy and its
+        body supplies the first range, so the object is only requested once before the range split.
+        """
+        if response is None:
+            with self.open_download(url) as response:
+                return self.download_file(url, dest, connections, response)
+                
+        size = int(response.headers.get("Content-Length", 0))
+        ranged = (
+            response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            and response.headers.get("Content-Encoding", "identity") == "identity"
+            and size >= connections * 1024 * 1024
+        )
+        
+        if not ranged:
+            # Size the file up front so the filesystem allocates it once instead of per write
+            if size:
+                dest.truncate(size)
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, dest, length=1024 * 1024)
+            dest.truncate()
+            return
+            
+        # If-Range makes a changed object come back as a 200, failing the 206 check below
+        # instead of mixing bytes from two versions
+        etag = response.headers.get("ETag", "")
+        if_range = etag if etag and not etag.startswith("W/") else response.headers.get("Last-Modified")
+        final_url = response.url
+        
+        # Preallocate, then write each range at its own offset; dest may be in-memory, so writes share one lock
+        dest.truncate(size)
+        lock = threading.Lock()
+        part_size = -(-size // connections)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        
+        def fetch_range(byte_range, source=None):
+            start, end = byte_range
+            if source is None:
+                headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+                if if_range:
+                    headers["If-Range"] = if_range
+                source = self.session.get(final_url, headers=headers, stream=True, timeout=60)
+                if source.status_code != 206:
+                    source.close()
+                    source.raise_for_status()
+                    raise OSError("server ignored the Range header or the file changed")
+                    
+            with source:
+                offset = start
+                while offset <= end:
+                    block = source.raw.read(min(1024 * 1024, end + 1 - offset))
+                    if not block:
+                        break
+                    with lock:
+                        dest.seek(offset)
+                        dest.write(block)
+                    offset += len(block)
+                    
+            # A short response would otherwise leave a zero-filled gap in the preallocated file
+            if offset != end + 1:
+                raise OSError(f"range {start}-{end} returned {offset - start} of {end - start + 1} bytes")
+                
+        # The open response already streams from byte 0, so it fills the first range
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [executor.submit(fetch_range, ranges[0], response)]
+            futures.extend(executor.submit(fetch_range, byte_range) for byte_range in ranges[1:])
+            for future in futures:
+                future.result()
+            
+    def write_if_changed(self, path, content):
+        """Write content to path only if it differs, so unchanged files keep their mtime"""
+        path = Path(path)
+        if path.exists() and path.read_text() == content:
+            return False
+        path.write_text(content)
+        return True
+        
+    def resolve_hidden_imports(self):
+        """Hidden imports that resolve in this environment, cached by main.py, requirements.txt and the list"""
+        key = hashlib.sha256()
+        for name in ("main.py", "requirements.txt"):
+            path = self.project_root / name
+            if path.exists():
+                key.update(path.read_bytes())
+        key.update(json.dumps(self.hidden_imports).encode())
+        key.update(sys.version.encode())
+        digest = key.hexdigest()
+        
+        cache_path = self.build_dir / "hiddenimports.cache.json"
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached.get("key") == digest:
+                return cached["modules"]
+        except (OSError, ValueError):
+            pass
+            
+        result = subprocess.run(
+            [sys.executable, "-c", RESOLVE_IMPORTS_SCRIPT],
+            input=json.dumps(self.hidden_imports), capture_output=True, text=True,
+            cwd=self.project_root
+        )
+        if result.returncode != 0:
+            return list(self.hidden_imports)
+            
+        modules = json.loads(result.stdout)
+        missing = [name for name in self.hidden_imports if name not in modules]
+        if missing:
+            print(f"   ⚠️ Dropping hidden imports that do not resolve: {', '.join(missing)}")
+            
+        self.build_dir.mkdir(exist_ok=True)
+        cache_path.write_text(json.dumps({"key": digest, "modules": modules}))
+        return modules
+        
+    def create_windows_pyinstaller_spec(self, ffmpeg_path):
+        """Create PyInstaller spec for Windows EXE around the downloaded FFmpeg"""
         print("📝 Creating Windows PyInstaller spec...")
         
-        ffmpeg_path = self.download_ffmpeg_windows()
         if not ffmpeg_path:
             print("❌ Cannot create spec without FFmpeg")
             return None
             
+        # Pruning needs the target's packages, so only do it when building on Windows itself
+        if sys.platform == "win32":
+            modules = self.resolve_hidden_imports()
+        else:
+            modules = self.hidden_imports
+        hidden_imports = "\n".join(f"    {name!r}," for name in modules)
+        
         spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 """
 Windows EXE PyInstaller spec for GoLive Studio
-Creates a single executable with all dependencies
+Creates a one-folder build with all dependencies
 """
 
 import sys
@@ -115,60 +329,7 @@ binaries = [
 
 # Hidden imports for Windows
 hiddenimports = [
-    # Core modules
-    'OpenGL',
-    'OpenGL.GL',
-    'OpenGL.arrays',
-    'numpy',
-    'numpy.core',
-    'numpy.core.multiarray',
-    'cv2',
-    
-    # Audio/Video processing
-    'av',
-    'av.audio',
-    'av.video',
-    'av.codec',
-    'av.container',
-    'av.stream',
-    
-    # Project modules
-    'renderer',
-    'renderer.base_renderer',
-    'renderer.opengl_renderer',
-    'renderer.gpu_graphics_output',
-    'renderer.migration_helper',
-    'encoder',
-    'encoder.base_encoder',
-    'encoder.x264_encoder',
-    'encoder.nvenc_encoder',
-    'encoder.vt_encoder',
-    'audio',
-    'audio.base_audio',
-    'audio.qt_audio',
-    'transitions',
-    'overlay_manager',
-    'text_overlay',
-    'config',
-    'streaming',
-    'recording',
-    'external_display',
-    'enhanced_external_display',
-    'graphics_output',
-    'enhanced_graphics_output',
-    'recording_settings_dialog',
-    'streaming_settings_dialog_improved',
-    'gpu_streaming',
-    'av_streamer',
-    'ffmpeg_utils',
-    
-    # Windows specific
-    'win32api',
-    'win32con',
-    'win32gui',
-    'pywintypes',
-    'win32clipboard',
-    'win32process',
+{hidden_imports}
 ]
 
 # Modules to exclude (reduce size)
@@ -182,6 +343,29 @@ excludes = [
     'PyQt6.Qt3DInput',
     'PyQt6.Qt3DAnimation',
     'PyQt6.QtQml',
+    # Qt modules the app never imports
+    'PyQt6.QtSvg',
+    'PyQt6.QtSvgWidgets',
+    'PyQt6.QtSql',
+    'PyQt6.QtPrintSupport',
+    'PyQt6.QtPdf',
+    'PyQt6.QtPdfWidgets',
+    'PyQt6.QtTest',
+    'PyQt6.QtXml',
+    'PyQt6.QtDesigner',
+    'PyQt6.QtHelp',
+    'PyQt6.QtNfc',
+    'PyQt6.QtPositioning',
+    'PyQt6.QtSensors',
+    'PyQt6.QtSerialPort',
+    'PyQt6.QtCharts',
+    'PyQt6.QtDataVisualization',
+    # Library tooling and test suites
+    'numpy.distutils',
+    'numpy.f2py',
+    'numpy.testing',
+    'cv2.data',
+    'PIL.ImageQt',
     'matplotlib',
     'scipy',
     'pandas',
@@ -206,36 +390,45 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=None,
     noarchive=False,
+    # Bytecode without asserts (needs PyInstaller >= 6.6). Level 1 rather than 2 keeps
+    # the docstrings some bundled libraries read at runtime
+    optimize=1,
 )
 
 # Remove duplicate files
 pyz = PYZ(a.pure, a.zipped_data, cipher=None)
 
-# Create single EXE file
+# One-folder build: the launcher loads Qt, FFmpeg and friends in place instead of
+# unpacking the whole archive to %TEMP% on every start
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='GoLive_Studio',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     icon='EditLive.ico',
     version='version_info.txt'
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='GoLive_Studio',
+)
 '''
         
         spec_path = self.project_root / "GoLive_Studio_Windows.spec"
-        with open(spec_path, 'w') as f:
-            f.write(spec_content)
+        self.write_if_changed(spec_path, spec_content)
             
         return spec_path
         
@@ -287,8 +480,7 @@ VSVersionInfo(
 '''
         
         version_path = self.project_root / "version_info.txt"
-        with open(version_path, 'w') as f:
-            f.write(version_info)
+        self.write_if_changed(version_path, version_info)
             
         return version_path
         
@@ -309,18 +501,12 @@ if errorlevel 1 (
 )
 
 echo Installing required packages...
-pip install --upgrade pip
-pip install PyInstaller>=6.0.0
-pip install PyQt6>=6.6.0
-pip install Pillow>=10.0.0
-pip install opencv-python>=4.8.0
-pip install numpy>=1.21.0
-pip install av>=10.0.0
-pip install PyOpenGL>=3.1.6
-pip install PyOpenGL-accelerate>=3.1.6
-pip install pywin32>=227
-pip install requests>=2.25.0
-pip install packaging>=21.0
+python -m pip install --upgrade pip
+REM One resolver run for everything; specifiers are quoted so ">" is not a redirect
+python -m pip install --no-input --disable-pip-version-check --prefer-binary ^
+    "PyInstaller>=6.6.0" "PyQt6>=6.6.0" "Pillow>=10.0.0" "opencv-python>=4.8.0" ^
+    "numpy>=1.21.0" "av>=10.0.0" "PyOpenGL>=3.1.6" "PyOpenGL-accelerate>=3.1.6" ^
+    "pywin32>=227" "requests>=2.25.0" "packaging>=21.0"
 
 if errorlevel 1 (
     echo ERROR: Failed to install required packages
@@ -345,8 +531,7 @@ pause
 '''
         
         script_path = self.project_root / "build_windows_exe.bat"
-        with open(script_path, 'w') as f:
-            f.write(build_script)
+        self.write_if_changed(script_path, build_script)
             
         return script_path
         
@@ -354,7 +539,7 @@ pause
         """Create NSIS script for EXE installer"""
         nsis_script = '''
 ; GoLive Studio EXE Installer
-; Creates a professional installer for the single EXE
+; Creates a professional installer for the application folder
 
 !define APP_NAME "GoLive Studio"
 !define APP_VERSION "1.0.0"
@@ -399,8 +584,8 @@ Section "Main Application" SecMain
     
     SetOutPath "$INSTDIR"
     
-    ; Install the EXE file
-    File "dist\\${APP_EXECUTABLE}"
+    ; Install the application folder
+    File /r "dist\\GoLive_Studio\\*.*"
     
     ; Create shortcuts
     CreateDirectory "$SMPROGRAMS\\${APP_NAME}"
@@ -422,8 +607,10 @@ Section "Main Application" SecMain
 SectionEnd
 
 Section "Uninstall"
+    ; Remove only what the installer put there; $INSTDIR may be a shared folder
     Delete "$INSTDIR\\${APP_EXECUTABLE}"
     Delete "$INSTDIR\\Uninstall.exe"
+    RMDir /r "$INSTDIR\\_internal"
     RMDir "$INSTDIR"
     
     Delete "$SMPROGRAMS\\${APP_NAME}\\${APP_NAME}.lnk"
@@ -437,8 +624,7 @@ SectionEnd
 '''
         
         nsis_path = self.project_root / "exe_installer.nsi"
-        with open(nsis_path, 'w') as f:
-            f.write(nsis_script)
+        self.write_if_changed(nsis_path, nsis_script)
             
         return nsis_path
         
@@ -450,19 +636,26 @@ SectionEnd
             print("⚠️ Not on Windows - creating build files for Windows execution")
             return self.create_build_files_for_windows()
             
-        # Windows-specific build
-        spec_path = self.create_windows_pyinstaller_spec()
+        # Windows-specific build; version info is written while FFmpeg downloads
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ffmpeg_future = executor.submit(self.download_ffmpeg_windows)
+            self.create_version_info()
+            ffmpeg_path = ffmpeg_future.result()
+            
+        spec_path = self.create_windows_pyinstaller_spec(ffmpeg_path)
         if not spec_path:
             return False
-            
-        self.create_version_info()
         
-        # Run PyInstaller
-        cmd = [sys.executable, "-m", "PyInstaller", "--clean", "--noconfirm", str(spec_path)]
+        # PyInstaller's work directory is kept between runs so unchanged analysis is reused
+        if self.rebuild:
+            shutil.rmtree(self.build_dir / spec_path.stem, ignore_errors=True)
+            
+        # Run PyInstaller; bytecode optimization is set by optimize= in the spec
+        cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm", str(spec_path)]
         result = subprocess.run(cmd, cwd=self.project_root)
         
         if result.returncode == 0:
-            exe_path = self.dist_dir / "GoLive_Studio.exe"
+            exe_path = self.dist_dir / "GoLive_Studio" / "GoLive_Studio.exe"
             if exe_path.exists():
                 exe_size = exe_path.stat().st_size / (1024 * 1024)  # MB
                 print(f"✅ Windows EXE created: {exe_path} ({exe_size:.1f} MB)")
@@ -478,19 +671,13 @@ SectionEnd
         """Create all necessary files for Windows build"""
         print("📝 Creating Windows build files...")
         
-        # Create all build files
-        self.create_windows_pyinstaller_spec()
-        self.create_version_info()
-        self.create_windows_build_script()
-        self.create_nsis_exe_installer()
-        
         # Create comprehensive README
         readme_content = '''# GoLive Studio Windows EXE Builder
 
 ## Quick Start (Windows)
 1. Run: build_windows_exe.bat
 2. Wait for build to complete
-3. Find GoLive_Studio.exe in dist/ folder
+3. Find GoLive_Studio.exe in dist/GoLive_Studio/ folder
 
 ## Manual Build (Windows)
 1. Install Python 3.8+ from https://python.org
@@ -499,11 +686,11 @@ SectionEnd
 4. Optional: Create installer with NSIS
 
 ## Output Files
-- GoLive_Studio.exe - Single executable file (all-in-one)
+- GoLive_Studio/ - Application folder with GoLive_Studio.exe
 - GoLive_Studio_Installer.exe - Professional installer (with NSIS)
 
 ## Features
-- Single EXE file with all dependencies
+- Self-contained application folder with all dependencies
 - FFmpeg bundled internally
 - No external requirements
 - Professional Windows installer available
@@ -514,6 +701,12 @@ SectionEnd
 - DirectX 11 compatible graphics
 - 2GB free disk space
 
+## Notes
+- UPX compression is disabled on purpose: it slows the build, makes every
+  DLL decompress at startup and often trips antivirus false positives
+- The spec builds with optimize=1 (PyInstaller 6.6+), so bundled bytecode
+  has asserts stripped; code must not rely on them at runtime
+
 ## Troubleshooting
 - Ensure Python is in PATH
 - Run as Administrator if needed
@@ -524,8 +717,18 @@ For support: https://golivestudio.com
 '''
         
         readme_path = self.project_root / "WINDOWS_EXE_README.md"
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        
+        # The writers below don't need FFmpeg, so they run while it downloads
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ffmpeg_future = executor.submit(self.download_ffmpeg_windows)
+            
+            self.create_version_info()
+            self.create_windows_build_script()
+            self.create_nsis_exe_installer()
+            self.write_if_changed(readme_path, readme_content)
+            
+            # The spec embeds the FFmpeg path, so it is written last
+            self.create_windows_pyinstaller_spec(ffmpeg_future.result())
             
         print("✅ Windows build files created!")
         print("📁 Files created:")
@@ -538,7 +741,7 @@ For support: https://golivestudio.com
         print("🪟 To build EXE on Windows:")
         print("   1. Copy all files to Windows machine")
         print("   2. Run: build_windows_exe.bat")
-        print("   3. Find GoLive_Studio.exe in dist/ folder")
+        print("   3. Find GoLive_Studio.exe in dist/GoLive_Studio/ folder")
         
         return True
         
@@ -562,5 +765,10 @@ For support: https://golivestudio.com
         return success
 
 if __name__ == "__main__":
-    builder = WindowsEXEBuilder()
+    # --no-cache always downloads FFmpeg instead of using ~/.cache (for CI)
+    # --rebuild discards PyInstaller's cached analysis under build/
+    builder = WindowsEXEBuilder(
+        use_cache="--no-cache" not in sys.argv[1:],
+        rebuild="--rebuild" in sys.argv[1:],
+    )
     builder.build()
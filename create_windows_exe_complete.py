@@ -5,46 +5,120 @@ Complete Windows EXE Builder for GoLive Studio
 Creates a fully functional Windows executable with all dependencies
 """
 
+import contextlib
 import os
 import sys
 import subprocess
 import shutil
-import tempfile
+import hashlib
+import struct
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import zipfile
+import tempfile
+import threading
+from collections import deque
 import requests
+from requests.adapters import HTTPAdapter
+
+# Downloaded FFmpeg archives are kept here between builds, keyed by source URL
+FFMPEG_CACHE_DIR = Path.home() / '.cache' / 'golive-build' / 'ffmpeg'
+
+# Run in a child interpreter so importing the candidates leaves the builder untouched
+RESOLVE_IMPORTS_SCRIPT = '''
+import importlib.util, json, sys
+found = []
+for name in json.load(sys.stdin):
+    try:
+        if importlib.util.find_spec(name) is not None:
+            found.append(name)
+    except Exception:
+        pass
+json.dump(found, sys.stdout)
+'''
+
+# Formats that are already compressed; deflating them again only burns CPU
+STORED_SUFFIXES = {'.zip', '.pyz', '.7z', '.gz', '.png', '.jpg', '.jpeg', '.mp4', '.mp3'}
+
+# Files up to this size are read ahead on worker threads while the zip writer compresses;
+# larger ones are streamed by ZipFile.write so read-ahead memory stays bounded
+ZIP_PREFETCH_MAX_BYTES = 16 * 1024 * 1024
+ZIP_PREFETCH_WINDOW = 32
+
+# PE header values for a 64-bit Windows GUI executable
+PE_MACHINE_AMD64 = 0x8664
+PE_SUBSYSTEM_GUI = 2
+
+
+def fast_copy(src, dst):
+    """Hard-link src to dst when possible, else copy it with a 1 MiB buffer and keep its metadata."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+        shutil.copystat(src, dst)
+    return dst
 
 
 class WindowsEXEBuilder:
     """Creates complete Windows EXE packages."""
     
-    def __init__(self):
+    # Windows-specific dependencies installed before the build
+    windows_packages = [
+        'pywin32>=227',
+        'pywin32-ctypes>=0.2.0',
+        'comtypes>=1.1.0',
+        # The generated spec's Analysis(optimize=...) needs PyInstaller 6.6
+        'pyinstaller>=6.6',
+    ]
+    
+    # Project packages main.py's import graph never reaches. Qt, numpy, cv2, av and the
+    # statically imported project modules are found by analysis and PyInstaller's hooks,
+    # and each package's __init__ pulls in its own submodules
+    hidden_imports = [
+        'encoder',
+        'audio',
+    ]
+    
+    def __init__(self, use_cache=True, rebuild=False):
         self.project_root = Path(__file__).parent
         self.dist_dir = self.project_root / 'dist'
         self.build_dir = self.project_root / 'build'
         self.app_name = 'GoLive Studio'
         self.exe_name = 'GoLive Studio.exe'
-        self.exe_path = self.dist_dir / self.exe_name
+        self.app_dir = self.dist_dir / self.app_name
+        self.exe_path = self.app_dir / self.exe_name
+        self.use_cache = use_cache
+        # One pooled session so the HEAD probe and every range worker reuse warm TLS connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=8))
+        self.rebuild = rebuild
         
     def setup_windows_environment(self):
-        """Set up Windows-specific build environment."""
+        """Start installing Windows-specific dependencies in the background; returns the pip process."""
         print("🪟 Setting up Windows build environment...")
         
-        # Install Windows-specific dependencies
-        windows_packages = [
-            'pywin32>=227',
-            'pywin32-ctypes>=0.2.0',
-            'comtypes>=1.1.0',
-        ]
-        
-        for package in windows_packages:
-            try:
-                subprocess.run([
-                    sys.executable, '-m', 'pip', 'install', '--upgrade', package
-                ], check=True, capture_output=True)
+        # One pip run resolves everything at once instead of paying startup + resolve per package
+        return subprocess.Popen([
+            sys.executable, '-m', 'pip', 'install', '--upgrade',
+            '--no-input', '--disable-pip-version-check', '--prefer-binary',
+            *self.windows_packages
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    
+    def wait_for_windows_environment(self, pip_proc):
+        """Wait for the pip process started by setup_windows_environment and report the result."""
+        _, stderr = pip_proc.communicate()
+        if pip_proc.returncode == 0:
+            for package in self.windows_packages:
                 print(f"   ✅ {package}")
-            except subprocess.CalledProcessError:
-                print(f"   ⚠️ Failed to install {package}")
+            return True
+        
+        print(f"   ⚠️ Failed to install {', '.join(self.windows_packages)}")
+        if stderr:
+            print(f"   {stderr.strip().splitlines()[-1]}")
+        return False
     
     def download_windows_ffmpeg(self):
         """Download FFmpeg for Windows."""
@@ -64,40 +138,217 @@ class WindowsEXEBuilder:
             print("   📥 Downloading FFmpeg for Windows...")
             url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                zip_path = temp_path / 'ffmpeg.zip'
-                
-                # Download
-                response = requests.get(url, stream=True)
-                response.raise_for_status()
+            with contextlib.ExitStack() as stack:
+                if self.use_cache:
+                    zip_source = self.cached_download(url)
+                else:
+                    # Uncached, the archive is only read once, so keep it in RAM and let ZipFile seek there
+                    zip_source = stack.enter_context(tempfile.SpooledTemporaryFile(max_size=256 * 1024 * 1024))
+                    self.download_file(url, zip_source)
+                    zip_source.seek(0)
                 
-                with open(zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                with zipfile.ZipFile(zip_source, 'r') as zip_ref:
+                    if self.extract_ffmpeg_member(zip_ref, ffmpeg_exe):
+                        print(f"   ✅ FFmpeg extracted: {ffmpeg_exe}")
+                        return True
+            
+            print("   ❌ FFmpeg.exe not found in download")
+            return False
+            
+        except Exception as e:
+            print(f"   ❌ FFmpeg download failed: {e}")
+            return False
+    
+    def extract_ffmpeg_member(self, zip_ref, ffmpeg_exe):
+        """Stream only ffmpeg.exe out of the archive, located from its entry names; True if found."""
+        for info in zip_ref.infolist():
+            # Some Windows zip tools store backslash-separated names
+            if info.filename.replace('\\', '/').rsplit('/', 1)[-1] == 'ffmpeg.exe':
+                with zip_ref.open(info) as src, open(ffmpeg_exe, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
+                return True
+        return False
+    
+    def cached_download(self, url):
+        """Return a local copy of url's zip, revalidating a cached copy with one conditional GET."""
+        FFMPEG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        key = hashlib.sha256(url.encode()).hexdigest()
+        zip_path = FFMPEG_CACHE_DIR / f'{key}.zip'
+        meta_path = FFMPEG_CACHE_DIR / f'{key}.meta.json'
+        
+        # Validators saved with the cached copy make the GET conditional; a missing or
+        # damaged meta file just means a full download
+        headers = {}
+        if zip_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
                 
-                # Extract
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_path)
+        try:
+            response = self.open_download(url, headers)
+        except requests.RequestException:
+            if zip_path.exists():
+                print("   ⚠️ Could not reach the FFmpeg server, using the cached archive")
+                return zip_path
+            raise
+            
+        with response:
+            if response.status_code == 304:
+                print(f"   ✅ Using cached FFmpeg archive: {zip_path}")
+                return zip_path
                 
-                # Find and copy ffmpeg.exe
-                for ffmpeg_file in temp_path.rglob('ffmpeg.exe'):
-                    shutil.copy2(ffmpeg_file, ffmpeg_exe)
-                    print(f"   ✅ FFmpeg extracted: {ffmpeg_exe}")
-                    return True
+            # Download next to the cache entry and rename, so an interrupted build never leaves a partial zip
+            partial_path = zip_path.with_suffix('.part')
+            with open(partial_path, 'w+b') as f:
+                self.download_file(url, f, response=response)
+            meta = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+            
+        os.replace(partial_path, zip_path)
+        partial_meta_path = meta_path.with_suffix('.part')
+        partial_meta_path.write_text(json.dumps(meta))
+        os.replace(partial_meta_path, meta_path)
+        return zip_path
+        
+    def open_download(self, url, headers=None):
+        """Start a streaming GET of url's raw bytes, which download_file can continue from."""
+        # Byte ranges address the raw entity, so ask for it unencoded throughout
+        response = self.session.get(url, headers={'Accept-Encoding': 'identity', **(headers or {})},
+                                    stream=True, timeout=60)
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            response.close()
+            raise
+        return response
+        
+    def download_file(self, url, dest, connections=8, response=None):
+        """Download url into the seekable file object dest, over parallel byte ranges when the server allows it.
+        
+        response is an already-open GET from open_download; its headers decide the strategy and its
+        body supplies the first range, so the object is only requested once before the range split.
+        """
+        if response is None:
+            with self.open_download(url) as response:
+                return self.download_file(url, dest, connections, response)
                 
-                print("   ❌ FFmpeg.exe not found in download")
-                return False
+        size = int(response.headers.get('Content-Length', 0))
+        ranged = (
+            response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+            and response.headers.get('Content-Encoding', 'identity') == 'identity'
+            and size >= connections * 1024 * 1024
+        )
+        
+        if not ranged:
+            # Size the file up front so the filesystem allocates it once instead of per write
+            if size:
+                dest.truncate(size)
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, dest, length=1024 * 1024)
+            dest.truncate()
+            return
+            
+        # If-Range makes a changed object come back as a 200, failing the 206 check below
+        # instead of mixing bytes from two versions
+        etag = response.headers.get('ETag', '')
+        if_range = etag if etag and not etag.startswith('W/') else response.headers.get('Last-Modified')
+        final_url = response.url
+        
+        # Preallocate, then write each range at its own offset; dest may be in-memory, so writes share one lock
+        dest.truncate(size)
+        lock = threading.Lock()
+        part_size = -(-size // connections)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        
+        def fetch_range(byte_range, source=None):
+            start, end = byte_range
+            if source is None:
+                headers = {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+                if if_range:
+                    headers['If-Range'] = if_range
+                source = self.session.get(final_url, headers=headers, stream=True, timeout=60)
+                if source.status_code != 206:
+                    source.close()
+                    source.raise_for_status()
+                    raise OSError('server ignored the Range header or the file changed')
+                    
+            with source:
+                offset = start
+                while offset <= end:
+                    block = source.raw.read(min(1024 * 1024, end + 1 - offset))
+                    if not block:
+                        break
+                    with lock:
+                        dest.seek(offset)
+                        dest.write(block)
+                    offset += len(block)
+                    
+            # A short response would otherwise leave a zero-filled gap in the preallocated file
+            if offset != end + 1:
+                raise OSError(f'range {start}-{end} returned {offset - start} of {end - start + 1} bytes')
                 
-        except Exception as e:
-            print(f"   ❌ FFmpeg download failed: {e}")
+        # The open response already streams from byte 0, so it fills the first range
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [executor.submit(fetch_range, ranges[0], response)]
+            futures.extend(executor.submit(fetch_range, byte_range) for byte_range in ranges[1:])
+            for future in futures:
+                future.result()
+    
+    def write_if_changed(self, path, content):
+        """Write content to path only if it differs, so unchanged files keep their mtime."""
+        path = Path(path)
+        if path.exists() and path.read_text() == content:
             return False
+        path.write_text(content)
+        return True
+    
+    def resolve_hidden_imports(self):
+        """Hidden imports that resolve in this environment, cached by main.py, requirements.txt and the list."""
+        key = hashlib.sha256()
+        for name in ('main.py', 'requirements.txt'):
+            path = self.project_root / name
+            if path.exists():
+                key.update(path.read_bytes())
+        key.update(json.dumps(self.hidden_imports).encode())
+        key.update(sys.version.encode())
+        digest = key.hexdigest()
+        
+        cache_path = self.build_dir / 'hiddenimports.cache.json'
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached.get('key') == digest:
+                return cached['modules']
+        except (OSError, ValueError):
+            pass
+        
+        result = subprocess.run(
+            [sys.executable, '-c', RESOLVE_IMPORTS_SCRIPT],
+            input=json.dumps(self.hidden_imports), capture_output=True, text=True,
+            cwd=self.project_root
+        )
+        if result.returncode != 0:
+            return list(self.hidden_imports)
+        
+        modules = json.loads(result.stdout)
+        missing = [name for name in self.hidden_imports if name not in modules]
+        if missing:
+            print(f"   ⚠️ Dropping hidden imports that do not resolve: {', '.join(missing)}")
+        
+        self.build_dir.mkdir(exist_ok=True)
+        cache_path.write_text(json.dumps({'key': digest, 'modules': modules}))
+        return modules
     
     def create_windows_spec(self):
         """Create Windows-specific PyInstaller spec."""
         print("📝 Creating Windows PyInstaller spec...")
         
-        spec_content = '''# -*- mode: python ; coding: utf-8 -*-
+        hidden_imports = '\n'.join(f'    {name!r},' for name in self.resolve_hidden_imports())
+        
+        spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 """
 Windows-specific PyInstaller spec for GoLive Studio
 """
@@ -111,53 +362,7 @@ project_root = Path(__file__).parent
 
 # All hidden imports for Windows
 hidden_imports = [
-    # PyQt6 modules
-    'PyQt6.QtCore',
-    'PyQt6.QtGui', 
-    'PyQt6.QtWidgets',
-    'PyQt6.QtOpenGL',
-    'PyQt6.QtOpenGLWidgets',
-    'PyQt6.QtMultimedia',
-    'PyQt6.QtMultimediaWidgets',
-    'PyQt6.sip',
-    
-    # Windows-specific
-    'win32api',
-    'win32con',
-    'win32gui',
-    'win32process',
-    'win32security',
-    'win32service',
-    'win32serviceutil',
-    'pywintypes',
-    'comtypes',
-    'comtypes.client',
-    
-    # Audio/Video
-    'av',
-    'cv2',
-    'numpy',
-    'PIL',
-    'PIL.Image',
-    
-    # OpenGL
-    'OpenGL',
-    'OpenGL.GL',
-    'OpenGL.arrays',
-    
-    # System
-    'psutil',
-    'threading',
-    'multiprocessing',
-    'queue',
-    'subprocess',
-    'ctypes',
-    'ctypes.wintypes',
-    
-    # Project modules
-    'audio',
-    'encoder',
-    'renderer',
+{hidden_imports}
 ]
 
 # Data files
@@ -187,7 +392,7 @@ a = Analysis(
     datas=datas,
     hiddenimports=hidden_imports,
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
     excludes=[
         'tkinter',
@@ -195,29 +400,52 @@ a = Analysis(
         'scipy',
         'pandas',
         'jupyter',
+        # Qt modules the app never imports
+        'PyQt6.QtSvg',
+        'PyQt6.QtSvgWidgets',
+        'PyQt6.QtSql',
+        'PyQt6.QtPrintSupport',
+        'PyQt6.QtPdf',
+        'PyQt6.QtPdfWidgets',
+        'PyQt6.QtTest',
+        'PyQt6.QtXml',
+        'PyQt6.QtDesigner',
+        'PyQt6.QtHelp',
+        'PyQt6.QtNfc',
+        'PyQt6.QtPositioning',
+        'PyQt6.QtSensors',
+        'PyQt6.QtSerialPort',
+        'PyQt6.QtCharts',
+        'PyQt6.QtDataVisualization',
+        # Library tooling and test suites
+        'numpy.distutils',
+        'numpy.f2py',
+        'numpy.testing',
+        'cv2.data',
+        'PIL.ImageQt',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=None,
     noarchive=False,
+    # Bytecode without asserts (needs PyInstaller >= 6.6). Level 1 rather than 2 keeps
+    # the docstrings some bundled libraries read at runtime
+    optimize=1,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=None)
 
+# One-folder build: nothing is unpacked to %TEMP% at startup
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='GoLive Studio',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -226,11 +454,20 @@ exe = EXE(
     entitlements_file=None,
     icon='EditLive.ico',
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='GoLive Studio',
+)
 '''
         
         spec_path = self.project_root / 'GoLive_Studio_Windows.spec'
-        with open(spec_path, 'w') as f:
-            f.write(spec_content)
+        self.write_if_changed(spec_path, spec_content)
         
         print(f"   ✅ Windows spec created: {spec_path}")
         return spec_path
@@ -242,10 +479,13 @@ exe = EXE(
         # Create spec file
         spec_path = self.create_windows_spec()
         
-        # Build command
+        # PyInstaller's work directory is kept between runs so unchanged analysis is reused
+        if self.rebuild:
+            shutil.rmtree(self.build_dir / spec_path.stem, ignore_errors=True)
+        
+        # Build command; bytecode optimization is set by optimize= in the spec
         cmd = [
             sys.executable, '-m', 'PyInstaller',
-            '--clean',
             '--noconfirm',
             str(spec_path)
         ]
@@ -266,6 +506,27 @@ exe = EXE(
             print(f"❌ Build failed: {e}")
             return False
     
+    def read_zip_entry(self, file_path):
+        """Read a small file for the zip writer; None for files it should stream itself."""
+        if file_path.stat().st_size > ZIP_PREFETCH_MAX_BYTES:
+            return None
+        return file_path.read_bytes()
+    
+    def write_zip_entry(self, zipf, root, file_path, data_future):
+        """Add one file to the installer zip, storing already-compressed formats as-is."""
+        arcname = str(file_path.relative_to(root))
+        if file_path.suffix.lower() in STORED_SUFFIXES:
+            compress_type = zipfile.ZIP_STORED
+        else:
+            compress_type = zipfile.ZIP_DEFLATED
+        
+        data = data_future.result()
+        if data is None:
+            zipf.write(file_path, arcname, compress_type=compress_type)
+        else:
+            info = zipfile.ZipInfo.from_file(file_path, arcname)
+            zipf.writestr(info, data, compress_type=compress_type, compresslevel=zipf.compresslevel)
+    
     def create_windows_installer(self):
         """Create Windows installer package."""
         print("📦 Creating Windows installer package...")
@@ -278,10 +539,9 @@ exe = EXE(
         installer_dir = self.dist_dir / 'GoLive Studio Windows'
         if installer_dir.exists():
             shutil.rmtree(installer_dir)
-        installer_dir.mkdir()
         
-        # Copy EXE
-        shutil.copy2(self.exe_path, installer_dir / self.exe_name)
+        # Copy the application folder (EXE plus its libraries and data)
+        shutil.copytree(self.app_dir, installer_dir, copy_function=fast_copy)
         
         # Copy additional files
         additional_files = [
@@ -293,7 +553,7 @@ exe = EXE(
         for file_name in additional_files:
             file_path = self.project_root / file_name
             if file_path.exists():
-                shutil.copy2(file_path, installer_dir / file_name)
+                fast_copy(file_path, installer_dir / file_name)
         
         # Create installation script
         install_script = installer_dir / 'install.bat'
@@ -323,11 +583,19 @@ pause
         zip_path = self.dist_dir / 'GoLive Studio Windows.zip'
         
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in installer_dir.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(installer_dir)
-                        zipf.write(file_path, arcname)
+            files = [file_path for file_path in installer_dir.rglob('*') if file_path.is_file()]
+            
+            # ZipFile writes must stay on one thread, so workers only read ahead.
+            # Level 1 keeps most of the gain on DLLs and the EXE at a fraction of the CPU
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf, \
+                    ThreadPoolExecutor(max_workers=8) as executor:
+                pending = deque()
+                for file_path in files:
+                    pending.append((file_path, executor.submit(self.read_zip_entry, file_path)))
+                    if len(pending) >= ZIP_PREFETCH_WINDOW:
+                        self.write_zip_entry(zipf, installer_dir, *pending.popleft())
+                while pending:
+                    self.write_zip_entry(zipf, installer_dir, *pending.popleft())
             
             size_mb = zip_path.stat().st_size / (1024 * 1024)
             print(f"✅ Windows installer created: {zip_path} ({size_mb:.1f} MB)")
@@ -338,41 +606,49 @@ pause
             return False
     
     def verify_exe(self):
-        """Verify the created EXE."""
+        """Verify the created EXE from its PE headers, without launching the GUI."""
         print("🔍 Verifying Windows EXE...")
         
         if not self.exe_path.exists():
             print(f"❌ EXE not found: {self.exe_path}")
             return False
         
-        try:
-            # Check if EXE is valid
-            result = subprocess.run([str(self.exe_path), '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            
-            size_mb = self.exe_path.stat().st_size / (1024 * 1024)
-            print(f"✅ EXE verified successfully ({size_mb:.1f} MB)")
-            return True
-            
-        except subprocess.TimeoutExpired:
-            print("⚠️ EXE verification timeout (but file exists)")
-            return True
-        except Exception as e:
-            print(f"⚠️ EXE verification warning: {e}")
-            return True  # Continue even if verification has issues
+        with open(self.exe_path, 'rb') as f:
+            header = f.read(4096)
+        
+        # DOS header -> e_lfanew -> PE signature, COFF header, optional header
+        pe_offset = struct.unpack_from('<I', header, 0x3C)[0] if header[:2] == b'MZ' and len(header) >= 0x40 else 0
+        if not pe_offset or len(header) < pe_offset + 24 + 70 or header[pe_offset:pe_offset + 4] != b'PE\0\0':
+            print("❌ EXE is not a valid PE image")
+            return False
+        
+        machine = struct.unpack_from('<H', header, pe_offset + 4)[0]
+        subsystem = struct.unpack_from('<H', header, pe_offset + 24 + 68)[0]
+        if machine != PE_MACHINE_AMD64:
+            print(f"⚠️ EXE targets machine 0x{machine:04x}, expected AMD64")
+        if subsystem != PE_SUBSYSTEM_GUI:
+            print(f"⚠️ EXE subsystem is {subsystem}, expected Windows GUI")
+        
+        if next(self.app_dir.glob('**/ffmpeg/ffmpeg.exe'), None) is None:
+            print("⚠️ FFmpeg is not bundled in the application folder")
+        
+        size_mb = self.exe_path.stat().st_size / (1024 * 1024)
+        print(f"✅ EXE verified successfully ({size_mb:.1f} MB)")
+        return True
     
     def build_complete_windows_package(self):
         """Build complete Windows package."""
         print(f"\n🪟 Creating Windows EXE for {self.app_name}")
         print("=" * 50)
         
-        # Step 1: Setup environment
-        self.setup_windows_environment()
+        # Steps 1 and 2: pip and the FFmpeg download are independent, so overlap them
+        pip_proc = self.setup_windows_environment()
         
-        # Step 2: Download FFmpeg
         if not self.download_windows_ffmpeg():
             print("⚠️ FFmpeg setup failed, continuing without it")
         
+        self.wait_for_windows_environment(pip_proc)
+        
         # Step 3: Build EXE
         if not self.build_windows_exe():
             return False
@@ -394,7 +670,12 @@ pause
 
 def main():
     """Main function."""
-    builder = WindowsEXEBuilder()
+    # --no-cache always downloads FFmpeg instead of using ~/.cache (for CI)
+    # --rebuild discards PyInstaller's cached analysis under build/
+    builder = WindowsEXEBuilder(
+        use_cache='--no-cache' not in sys.argv[1:],
+        rebuild='--rebuild' in sys.argv[1:],
+    )
     success = builder.build_complete_windows_package()
     
     if not success:
@@ -7,6 +7,7 @@ from .base_encoder import BaseEncoder, EncoderSettings, EncoderCapabilities
 from .x264_encoder import X264Encoder
 
 # Platform-specific encoder imports
+import concurrent.futures
 import sys
 
 try:
@@ -27,6 +28,40 @@ else:
     _HAS_VT = False
     VideoToolboxEncoder = None
 
+# Probe hardware encoders concurrently in the background so results are ready by first use
+_probe_futures = {}
+_deep_probe_futures = {}
+if _HAS_NVENC or _HAS_VT:
+    _probe_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='encoder-probe')
+    _probes = {}
+    if _HAS_NVENC:
+        from .nvenc_encoder import _probe_nvenc
+        _probes['nvenc'] = _probe_nvenc
+    if _HAS_VT:
+        from .vt_encoder import _probe_videotoolbox
+        _probes['videotoolbox'] = _probe_videotoolbox
+    for _name, _probe in _probes.items():
+        _probe_futures[_name] = _probe_executor.submit(_probe)
+    # Queued after every shallow probe, so a deep probe never holds a worker its own shallow probe needs
+    for _name, _probe in _probes.items():
+        _deep_probe_futures[_name] = _probe_executor.submit(
+            lambda shallow=_probe_futures[_name], probe=_probe: shallow.result() and probe(deep_probe=True)
+        )
+    _probe_executor.shutdown(wait=False)
+
+
+def _hardware_available(name: str, deep_probe: bool = False) -> bool:
+    """
+    Result of the background probe for a hardware encoder, waiting if it is still running
+    
+    The shallow probe only lists FFmpeg's encoders, which include h264_nvenc
+    even without an NVIDIA GPU; deep_probe=True waits for the background test
+    encode instead, which only starts once the shallow probe has succeeded.
+    """
+    futures = _deep_probe_futures if deep_probe else _probe_futures
+    future = futures.get(name)
+    return future is not None and bool(future.result())
+
 
 def get_available_encoders() -> list:
     """Get list of available encoders on current platform"""
@@ -41,7 +76,7 @@ def get_available_encoders() -> list:
     })
     
     # Hardware encoders
-    if _HAS_NVENC:
+    if _hardware_available('nvenc'):
         encoders.append({
             'name': 'nvenc',
             'type': 'hardware',
@@ -49,7 +84,7 @@ def get_available_encoders() -> list:
             'description': 'NVIDIA Hardware H.264 encoder'
         })
     
-    if _HAS_VT:
+    if _hardware_available('videotoolbox'):
         encoders.append({
             'name': 'videotoolbox',
             'type': 'hardware', 
@@ -72,19 +107,19 @@ def create_encoder(encoder_type='auto', **kwargs) -> BaseEncoder:
         BaseEncoder: Configured encoder instance
     """
     if encoder_type == 'auto':
-        # Auto-select best available encoder
-        if _HAS_NVENC:
+        # Auto-select the best encoder that can actually encode on this machine
+        if _hardware_available('nvenc', deep_probe=True):
             encoder_type = 'nvenc'
-        elif _HAS_VT:
+        elif _hardware_available('videotoolbox', deep_probe=True):
             encoder_type = 'videotoolbox'
         else:
             encoder_type = 'x264'
     
     if encoder_type == 'x264':
         return X264Encoder(**kwargs)
-    elif encoder_type == 'nvenc' and _HAS_NVENC:
+    elif encoder_type == 'nvenc' and _hardware_available('nvenc'):
         return NVENCEncoder(**kwargs)
-    elif encoder_type == 'videotoolbox' and _HAS_VT:
+    elif encoder_type == 'videotoolbox' and _hardware_available('videotoolbox'):
         return VideoToolboxEncoder(**kwargs)
     else:
         # Fallback to software encoder
@@ -95,8 +130,8 @@ def check_encoder_support() -> dict:
     """Check encoder support on current platform"""
     return {
         'x264': True,  # Always available via FFmpeg
-        'nvenc': _HAS_NVENC,
-        'videotoolbox': _HAS_VT,
+        'nvenc': _hardware_available('nvenc'),
+        'videotoolbox': _hardware_available('videotoolbox'),
         'available_encoders': get_available_encoders()
     }
 
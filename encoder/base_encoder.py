@@ -3,14 +3,47 @@ GoLive Studio - Base Encoder Abstract Interface
 Defines the abstract interface for video encoders
 """
 
+import os
+import queue
+import subprocess
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Callable
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Mapping, Sequence, Union
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 from PyQt6.QtCore import QObject, pyqtSignal, QSize
 from PyQt6.QtGui import QImage
 
 
+# Frames allowed in flight between encode_raw and the pipe writer thread
+_PIPE_QUEUE_DEPTH = 8
+# Most buffers one writev may carry (4 frames of Y + UV planes)
+_PIPE_BATCH_BUFFERS = 8
+# Bytes read from the FFmpeg stdout per encoded chunk
+_OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Bytes per pixel in the first plane of each raw input format, used to crop row padding
+_RAW_BYTES_PER_PIXEL = {
+    'rgba': 4, 'bgra': 4, 'bgr0': 4,
+    'rgb24': 3, 'bgr24': 3,
+    'gray': 1, 'nv12': 1,
+}
+
+# QImage formats whose memory layout FFmpeg reads directly as the given pix_fmt
+_QIMAGE_PIX_FMTS = {
+    QImage.Format.Format_RGBA8888: 'rgba',
+    QImage.Format.Format_RGB888: 'rgb24',
+    QImage.Format.Format_BGR888: 'bgr24',
+    QImage.Format.Format_Grayscale8: 'gray',
+    # 0xAARRGGBB words, i.e. B, G, R, A bytes on little-endian hosts
+    QImage.Format.Format_ARGB32: 'bgra',
+    QImage.Format.Format_RGB32: 'bgr0',
+}
+
+
 class EncoderType(Enum):
     """Encoder types"""
     SOFTWARE = "software"
@@ -38,9 +71,9 @@ class EncoderProfile(Enum):
     HIGH10 = "high10"
 
 
-@dataclass
+@dataclass(frozen=True)
 class EncoderSettings:
-    """Encoder configuration settings"""
+    """Encoder configuration settings (immutable; derive changes with dataclasses.replace)"""
     # Video settings
     width: int = 1920
     height: int = 1080
@@ -67,6 +100,11 @@ class EncoderSettings:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for FFmpeg parameters"""
+        return dict(self._dict)
+    
+    @cached_property
+    def _dict(self) -> Dict[str, Any]:
+        """to_dict() contents, built once; safe because the settings are frozen"""
         return {
             'width': self.width,
             'height': self.height,
@@ -129,6 +167,7 @@ class BaseEncoder(QObject, ABC):
         self._capabilities: Optional[EncoderCapabilities] = None
         self._initialized = False
         self._encoding = False
+        self._cached_args: Optional[list] = None  # get_ffmpeg_args result for _settings
         
         # Statistics
         self._stats = {
@@ -138,6 +177,19 @@ class BaseEncoder(QObject, ABC):
             'average_bitrate': 0.0,
             'dropped_frames': 0
         }
+        self._stats_last_emit = 0.0
+        self._stats_emit_interval = 0.25  # stats_updated at most 4 Hz; the UI needs no more
+        self._stats_lock = threading.RLock()  # the FFmpeg output reader updates stats too
+        
+        # Persistent FFmpeg process, one per session, fed raw frames on stdin
+        self._ffmpeg_proc: Optional[subprocess.Popen] = None
+        self._ffmpeg_input: Optional[tuple] = None  # (width, height, stride, pix_fmt) it was started for
+        self._output_thread: Optional[threading.Thread] = None
+        
+        # Asynchronous FFmpeg pipe writer
+        self._pipe_queue: Optional[queue.Queue] = None
+        self._pipe_thread: Optional[threading.Thread] = None
+        self._pipe_error: Optional[OSError] = None
         
         # Callbacks
         self._frame_callback: Optional[Callable[[bytes], None]] = None
@@ -169,17 +221,50 @@ class BaseEncoder(QObject, ABC):
         pass
     
     @abstractmethod
+    def encode_raw(self, data: Union[memoryview, Sequence[memoryview]], width: int, height: int,
+                   stride: int, pix_fmt: str) -> bool:
+        """
+        Encode a single raw frame without going through QImage
+        
+        Args:
+            data: Frame bytes, `height` rows of `stride` bytes (planes back to back for nv12),
+                  or a sequence of plane buffers (e.g. Y then UV) that is written without joining
+            width: Frame width in pixels
+            height: Frame height in pixels
+            stride: Bytes per row of the first plane
+            pix_fmt: FFmpeg pixel format name, e.g. 'nv12', 'rgba', 'bgra'
+            
+        Returns:
+            bool: Success status
+        """
+        pass
+    
     def encode_frame(self, frame: QImage) -> bool:
         """
         Encode a single frame
         
+        Passes the QImage's own pixel buffer to encode_raw without copying when
+        FFmpeg understands its format; other formats, and rows padded by a partial
+        pixel, are converted to RGBA first.
+        
         Args:
             frame: Input frame as QImage
             
         Returns:
             bool: Success status
         """
-        pass
+        if not frame or frame.isNull():
+            return False
+        
+        pix_fmt = _QIMAGE_PIX_FMTS.get(frame.format())
+        if pix_fmt is None or frame.bytesPerLine() % _RAW_BYTES_PER_PIXEL[pix_fmt]:
+            frame = frame.convertToFormat(QImage.Format.Format_RGBA8888)
+            pix_fmt = 'rgba'
+        
+        bits = frame.constBits()
+        bits.setsize(frame.sizeInBytes())
+        return self.encode_raw(memoryview(bits), frame.width(), frame.height(),
+                               frame.bytesPerLine(), pix_fmt)
     
     @abstractmethod
     def flush(self):
@@ -187,20 +272,31 @@ class BaseEncoder(QObject, ABC):
         pass
     
     @abstractmethod
-    def get_ffmpeg_args(self) -> list:
-        """Get FFmpeg command line arguments for this encoder"""
+    def _build_ffmpeg_args(self) -> list:
+        """Build FFmpeg command line arguments from the current settings"""
         pass
     
+    def _encode_args_for_input(self, pix_fmt: str) -> list:
+        """FFmpeg encoding arguments for raw frames arriving as pix_fmt"""
+        return self.get_ffmpeg_args()
+    
     # Common interface methods
     
     def set_settings(self, settings: EncoderSettings):
         """Update encoder settings"""
         self._settings = settings
+        self._cached_args = None
     
     def get_settings(self) -> EncoderSettings:
         """Get current encoder settings"""
         return self._settings
     
+    def get_ffmpeg_args(self) -> list:
+        """Get FFmpeg command line arguments for this encoder (built once per settings)"""
+        if self._cached_args is None:
+            self._cached_args = self._build_ffmpeg_args()
+        return list(self._cached_args)
+    
     def set_frame_callback(self, callback: Callable[[bytes], None]):
         """Set callback for encoded frame data"""
         self._frame_callback = callback
@@ -209,19 +305,22 @@ class BaseEncoder(QObject, ABC):
         """Set callback for error messages"""
         self._error_callback = callback
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get encoding statistics"""
-        return self._stats.copy()
+    def get_stats(self) -> Mapping[str, Any]:
+        """Get encoding statistics (read-only live view; copy it to keep a snapshot)"""
+        return MappingProxyType(self._stats)
     
     def reset_stats(self):
         """Reset encoding statistics"""
-        self._stats = {
-            'frames_encoded': 0,
-            'bytes_encoded': 0,
-            'encoding_fps': 0.0,
-            'average_bitrate': 0.0,
-            'dropped_frames': 0
-        }
+        # In place, so views handed out by get_stats stay live
+        with self._stats_lock:
+            self._stats.update(
+                frames_encoded=0,
+                bytes_encoded=0,
+                encoding_fps=0.0,
+                average_bitrate=0.0,
+                dropped_frames=0
+            )
+            self._stats_last_emit = 0.0
     
     def is_initialized(self) -> bool:
         """Check if encoder is initialized"""
@@ -265,9 +364,179 @@ class BaseEncoder(QObject, ABC):
         self.error_occurred.emit(message)
     
     def _update_stats(self, **kwargs):
-        """Update encoding statistics"""
-        self._stats.update(kwargs)
-        self.stats_updated.emit(self._stats.copy())
+        """Update encoding statistics, emitting stats_updated at a throttled rate"""
+        with self._stats_lock:
+            self._stats.update(kwargs)
+            
+            now = time.monotonic()
+            if now - self._stats_last_emit >= self._stats_emit_interval:
+                self._stats_last_emit = now
+                self.stats_updated.emit(self._stats.copy())
+    
+    def _flush_stats(self):
+        """Emit stats_updated now, so the final counts are not lost to the throttle"""
+        with self._stats_lock:
+            self._stats_last_emit = time.monotonic()
+            self.stats_updated.emit(self._stats.copy())
+    
+    def _write_pipe(self, stdin, buffers: Sequence[memoryview]):
+        """Write frame buffers to an FFmpeg stdin pipe, gathering them into one writev where available"""
+        if not hasattr(os, 'writev'):
+            for buf in buffers:
+                stdin.write(buf)
+            return
+        
+        # Anything still in the file object's buffer must reach the pipe first
+        stdin.flush()
+        fd = stdin.fileno()
+        views = [memoryview(buf).cast('B') for buf in buffers]
+        while views:
+            written = os.writev(fd, views)
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if views and written:
+                views[0] = views[0][written:]
+    
+    def _ensure_ffmpeg(self, width: int, height: int, stride: int, pix_fmt: str):
+        """
+        Make sure an FFmpeg process is running for frames of this layout
+        
+        The process is started by the session's first frame, since that is when
+        the input layout is known, and reused until the layout changes.
+        """
+        layout = (width, height, stride, pix_fmt)
+        if self._ffmpeg_proc is not None and self._ffmpeg_input == layout:
+            return
+        
+        self._close_ffmpeg()
+        
+        bytes_per_pixel = _RAW_BYTES_PER_PIXEL.get(pix_fmt)
+        if bytes_per_pixel is None or stride % bytes_per_pixel:
+            raise ValueError(f"Unsupported raw frame layout: {pix_fmt} with stride {stride}")
+        
+        # rawvideo has no stride option, so padded rows are read as extra columns and cropped
+        padded_width = stride // bytes_per_pixel
+        cmd = ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', pix_fmt, '-s', f'{padded_width}x{height}',
+               '-r', str(self._settings.fps), '-i', 'pipe:0']
+        if padded_width != width:
+            cmd.extend(['-vf', f'crop={width}:{height}:0:0'])
+        cmd.extend(self._encode_args_for_input(pix_fmt))
+        cmd.extend(['-f', 'h264', 'pipe:1'])
+        
+        self._ffmpeg_proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                             stderr=subprocess.DEVNULL, bufsize=0)
+        self._ffmpeg_input = layout
+        
+        self._output_thread = threading.Thread(target=self._read_ffmpeg_output,
+                                               args=(self._ffmpeg_proc.stdout,), daemon=True)
+        self._output_thread.start()
+        self._start_pipe_writer(self._ffmpeg_proc.stdin)
+    
+    def _read_ffmpeg_output(self, stdout):
+        """Forward encoded H.264 from the FFmpeg stdout until it closes"""
+        while True:
+            chunk = stdout.read(_OUTPUT_CHUNK_SIZE)
+            if not chunk:
+                break
+            self._emit_frame(chunk)
+            with self._stats_lock:
+                self._update_stats(bytes_encoded=self._stats['bytes_encoded'] + len(chunk))
+    
+    def _close_ffmpeg(self, timeout: float = 5.0):
+        """Write out pending frames, close the FFmpeg stdin and wait for it to finish"""
+        if self._ffmpeg_proc is None:
+            return
+        
+        proc = self._ffmpeg_proc
+        self._ffmpeg_proc = None
+        self._ffmpeg_input = None
+        
+        writer_stopped = self._stop_pipe_writer(timeout)
+        if not writer_stopped:
+            # The writer may still be inside writev on stdin; kill FFmpeg so that write
+            # fails with EPIPE instead of the fd being closed (and reused) under it
+            proc.kill()
+            proc.wait()
+            writer_stopped = self._stop_pipe_writer(timeout)
+        
+        if writer_stopped:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+        
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        
+        if self._output_thread is not None:
+            self._output_thread.join(timeout)
+            self._output_thread = None
+        
+        self._flush_stats()
+    
+    def _start_pipe_writer(self, stdin):
+        """Start a thread that drains queued frames into an FFmpeg stdin pipe"""
+        self._pipe_queue = queue.Queue(maxsize=_PIPE_QUEUE_DEPTH)
+        self._pipe_error = None
+        self._pipe_thread = threading.Thread(target=self._pipe_writer_loop,
+                                             args=(stdin, self._pipe_queue), daemon=True)
+        self._pipe_thread.start()
+    
+    def _queue_pipe_write(self, buffers: Sequence[memoryview]):
+        """Hand a frame to the pipe writer, blocking only while the queue is full"""
+        if self._pipe_error is not None:
+            raise self._pipe_error
+        
+        # Callers may reuse their buffers as soon as we return, so the queue holds copies
+        self._pipe_queue.put([bytes(buf) for buf in buffers])
+    
+    def _pipe_writer_loop(self, stdin, pending: queue.Queue):
+        """Write queued frames, coalescing whatever is already waiting into one writev"""
+        stopping = False
+        while not stopping:
+            frame = pending.get()
+            if frame is None:
+                break
+            
+            buffers = list(frame)
+            while len(buffers) < _PIPE_BATCH_BUFFERS:
+                try:
+                    frame = pending.get_nowait()
+                except queue.Empty:
+                    break
+                if frame is None:
+                    stopping = True
+                    break
+                buffers.extend(frame)
+            
+            # After a failure keep draining so producers never block on a dead pipe
+            if self._pipe_error is None:
+                try:
+                    self._write_pipe(stdin, buffers)
+                except OSError as e:
+                    self._pipe_error = e
+    
+    def _stop_pipe_writer(self, timeout: float = 5.0) -> bool:
+        """Write out queued frames and stop the pipe writer thread; False if it is still running"""
+        if self._pipe_thread is None:
+            return True
+        
+        try:
+            self._pipe_queue.put(None, timeout=timeout)
+        except queue.Full:
+            return False
+        
+        self._pipe_thread.join(timeout)
+        if self._pipe_thread.is_alive():
+            return False
+        
+        self._pipe_thread = None
+        self._pipe_queue = None
+        return True
     
     def _validate_settings(self, settings: EncoderSettings) -> bool:
         """Validate encoder settings against capabilities"""
@@ -3,12 +3,62 @@ GoLive Studio - NVENC Hardware Encoder
 NVIDIA hardware H.264 encoding
 """
 
+import functools
+import shutil
 import subprocess
 import sys
 from typing import Optional
-from PyQt6.QtGui import QImage
 
-from .base_encoder import BaseEncoder, EncoderSettings, EncoderCapabilities, EncoderType
+from .base_encoder import BaseEncoder, EncoderSettings, EncoderCapabilities, EncoderType, EncoderPreset
+
+# Software preset -> NVENC preset
+_NVENC_PRESETS = {
+    EncoderPreset.ULTRAFAST: 'p1',
+    EncoderPreset.SUPERFAST: 'p2',
+    EncoderPreset.VERYFAST: 'p3',
+    EncoderPreset.FASTER: 'p4',
+    EncoderPreset.FAST: 'p5',
+    EncoderPreset.MEDIUM: 'p6',
+    EncoderPreset.SLOW: 'p7',
+    EncoderPreset.SLOWER: 'p7',
+    EncoderPreset.VERYSLOW: 'p7',
+}
+
+# Raw formats h264_nvenc takes as-is, converting to YUV on the GPU instead of in swscale
+_NVENC_INPUT_PIX_FMTS = frozenset({'nv12', 'rgba', 'bgra', 'bgr0'})
+
+
+# One entry per probe depth: the encoder-list scan and the deep test encode
+@functools.lru_cache(maxsize=2)
+def _probe_nvenc(deep_probe: bool = False) -> bool:
+    """
+    Check NVENC availability once per process; encoders share the result
+    
+    The default scans `ffmpeg -encoders`, which never touches the hardware.
+    deep_probe=True runs a short test encode to confirm a working session.
+    """
+    if shutil.which('ffmpeg') is None:
+        return False
+    
+    try:
+        if not deep_probe:
+            result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    timeout=3, text=True)
+            return 'h264_nvenc' in result.stdout
+        
+        if not _probe_nvenc():
+            return False
+        
+        result = subprocess.run([
+            'ffmpeg', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=1',
+            '-c:v', 'h264_nvenc', '-f', 'null', '-'
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+        
+        return result.returncode == 0
+        
+    except Exception:
+        return False
 
 
 class NVENCEncoder(BaseEncoder):
@@ -20,22 +70,8 @@ class NVENCEncoder(BaseEncoder):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self._gpu_available = self._check_nvenc_support()
+        self._gpu_available = _probe_nvenc()
         
-    def _check_nvenc_support(self) -> bool:
-        """Check if NVENC is available on the system"""
-        try:
-            # Try to run ffmpeg with nvenc to check availability
-            result = subprocess.run([
-                'ffmpeg', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=1',
-                '-c:v', 'h264_nvenc', '-f', 'null', '-'
-            ], capture_output=True, timeout=10)
-            
-            return result.returncode == 0
-            
-        except Exception:
-            return False
-    
     def get_capabilities(self) -> EncoderCapabilities:
         """Get NVENC encoder capabilities"""
         return EncoderCapabilities(
@@ -55,7 +91,8 @@ class NVENCEncoder(BaseEncoder):
     def initialize(self, settings: EncoderSettings) -> bool:
         """Initialize NVENC encoder"""
         try:
-            if not self._gpu_available:
+            # The cheap encoder-list probe can't tell if the hardware works; check once before first use
+            if not self._gpu_available or not _probe_nvenc(deep_probe=True):
                 self._emit_error("NVENC not available on this system")
                 return False
             
@@ -63,7 +100,7 @@ class NVENCEncoder(BaseEncoder):
                 self._emit_error("Invalid NVENC settings")
                 return False
             
-            self._settings = settings
+            self.set_settings(settings)
             self._capabilities = self.get_capabilities()
             self._initialized = True
             
@@ -100,15 +137,19 @@ class NVENCEncoder(BaseEncoder):
     def stop_encoding(self):
         """Stop NVENC encoding session"""
         self._encoding = False
+        self._close_ffmpeg()
     
-    def encode_frame(self, frame: QImage) -> bool:
-        """Encode frame using NVENC"""
-        if not self._encoding or not frame or frame.isNull():
+    def encode_raw(self, data, width: int, height: int, stride: int, pix_fmt: str) -> bool:
+        """Encode a raw frame using NVENC"""
+        if not self._encoding:
             return False
         
         try:
-            # NVENC frame encoding would be handled by FFmpeg process
-            # This is a placeholder for the actual implementation
+            # The session's FFmpeg process is started by the first frame and reused after;
+            # separate planes are gathered by writev instead of being joined first
+            self._ensure_ffmpeg(width, height, stride, pix_fmt)
+            planes = data if isinstance(data, (list, tuple)) else (data,)
+            self._queue_pipe_write(planes)
             
             # Update stats
             self._stats['frames_encoded'] += 1
@@ -122,10 +163,10 @@ class NVENCEncoder(BaseEncoder):
     
     def flush(self):
         """Flush remaining frames"""
-        pass
+        self._close_ffmpeg()
     
-    def get_ffmpeg_args(self) -> list:
-        """Get FFmpeg arguments for NVENC encoding"""
+    def _build_ffmpeg_args(self) -> list:
+        """Build FFmpeg arguments for NVENC encoding"""
         args = []
         
         # Video codec
@@ -163,21 +204,17 @@ class NVENCEncoder(BaseEncoder):
         
         return args
     
+    def _encode_args_for_input(self, pix_fmt: str) -> list:
+        """Let NVENC take native input formats directly, skipping the CPU -pix_fmt conversion"""
+        args = self.get_ffmpeg_args()
+        if pix_fmt in _NVENC_INPUT_PIX_FMTS:
+            index = args.index('-pix_fmt')
+            del args[index:index + 2]
+        return args
+    
     def _get_nvenc_preset(self) -> str:
         """Map software preset to NVENC preset"""
-        preset_map = {
-            'ultrafast': 'p1',
-            'superfast': 'p2', 
-            'veryfast': 'p3',
-            'faster': 'p4',
-            'fast': 'p5',
-            'medium': 'p6',
-            'slow': 'p7',
-            'slower': 'p7',
-            'veryslow': 'p7'
-        }
-        
-        return preset_map.get(self._settings.preset.value, 'p4')
+        return _NVENC_PRESETS.get(self._settings.preset, 'p4')
     
     def get_nvenc_presets(self) -> dict:
         """Get NVENC-specific presets"""
@@ -200,15 +237,8 @@ class NVENCEncoder(BaseEncoder):
         }
     
     @staticmethod
-    def is_available() -> bool:
-        """Check if NVENC is available on the system"""
-        try:
-            result = subprocess.run([
-                'ffmpeg', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=1',
-                '-c:v', 'h264_nvenc', '-f', 'null', '-'
-            ], capture_output=True, timeout=10)
-            
-            return result.returncode == 0
-            
-        except Exception:
-            return False
+    def is_available(force: bool = False, deep_probe: bool = False) -> bool:
+        """Check if NVENC is available (force=True re-probes, deep_probe=True test-encodes)"""
+        if force:
+            _probe_nvenc.cache_clear()
+        return _probe_nvenc(deep_probe=True) if deep_probe else _probe_nvenc()
@@ -3,12 +3,59 @@ GoLive Studio - VideoToolbox Hardware Encoder (macOS)
 Apple VideoToolbox H.264 encoding
 """
 
+import functools
+import shutil
 import subprocess
 import sys
 from typing import Optional
-from PyQt6.QtGui import QImage
 
-from .base_encoder import BaseEncoder, EncoderSettings, EncoderCapabilities, EncoderType
+from .base_encoder import BaseEncoder, EncoderSettings, EncoderCapabilities, EncoderType, EncoderPreset
+
+# Software preset -> VideoToolbox quality value
+_VT_QUALITY = {
+    EncoderPreset.ULTRAFAST: 80,
+    EncoderPreset.SUPERFAST: 70,
+    EncoderPreset.VERYFAST: 60,
+    EncoderPreset.FASTER: 50,
+    EncoderPreset.FAST: 40,
+    EncoderPreset.MEDIUM: 30,
+    EncoderPreset.SLOW: 20,
+    EncoderPreset.SLOWER: 15,
+    EncoderPreset.VERYSLOW: 10,
+}
+
+
+# One entry per probe depth: the encoder-list scan and the deep test encode
+@functools.lru_cache(maxsize=2)
+def _probe_videotoolbox(deep_probe: bool = False) -> bool:
+    """
+    Check VideoToolbox availability once per process; encoders share the result
+    
+    The default scans `ffmpeg -encoders`, which never touches the hardware.
+    deep_probe=True runs a short test encode to confirm a working session.
+    """
+    if sys.platform != 'darwin' or shutil.which('ffmpeg') is None:
+        return False
+    
+    try:
+        if not deep_probe:
+            result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    timeout=3, text=True)
+            return 'h264_videotoolbox' in result.stdout
+        
+        if not _probe_videotoolbox():
+            return False
+        
+        result = subprocess.run([
+            'ffmpeg', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=1',
+            '-c:v', 'h264_videotoolbox', '-f', 'null', '-'
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+        
+        return result.returncode == 0
+        
+    except Exception:
+        return False
 
 
 class VideoToolboxEncoder(BaseEncoder):
@@ -20,22 +67,8 @@ class VideoToolboxEncoder(BaseEncoder):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self._available = sys.platform == 'darwin' and self._check_videotoolbox_support()
+        self._available = _probe_videotoolbox()
         
-    def _check_videotoolbox_support(self) -> bool:
-        """Check if VideoToolbox is available"""
-        try:
-            # Try to run ffmpeg with videotoolbox to check availability
-            result = subprocess.run([
-                'ffmpeg', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=1',
-                '-c:v', 'h264_videotoolbox', '-f', 'null', '-'
-            ], capture_output=True, timeout=10)
-            
-            return result.returncode == 0
-            
-        except Exception:
-            return False
-    
     def get_capabilities(self) -> EncoderCapabilities:
         """Get VideoToolbox encoder capabilities"""
         return EncoderCapabilities(
@@ -55,7 +88,8 @@ class VideoToolboxEncoder(BaseEncoder):
     def initialize(self, settings: EncoderSettings) -> bool:
         """Initialize VideoToolbox encoder"""
         try:
-            if not self._available:
+            # The cheap encoder-list probe can't tell if the hardware works; check once before first use
+            if not self._available or not _probe_videotoolbox(deep_probe=True):
                 self._emit_error("VideoToolbox not available on this system")
                 return False
             
@@ -63,7 +97,7 @@ class VideoToolboxEncoder(BaseEncoder):
                 self._emit_error("Invalid VideoToolbox settings")
                 return False
             
-            self._settings = settings
+            self.set_settings(settings)
             self._capabilities = self.get_capabilities()
             self._initialized = True
             
@@ -100,15 +134,19 @@ class VideoToolboxEncoder(BaseEncoder):
     def stop_encoding(self):
         """Stop VideoToolbox encoding session"""
         self._encoding = False
+        self._close_ffmpeg()
     
-    def encode_frame(self, frame: QImage) -> bool:
-        """Encode frame using VideoToolbox"""
-        if not self._encoding or not frame or frame.isNull():
+    def encode_raw(self, data, width: int, height: int, stride: int, pix_fmt: str) -> bool:
+        """Encode a raw frame using VideoToolbox"""
+        if not self._encoding:
             return False
         
         try:
-            # VideoToolbox frame encoding would be handled by FFmpeg process
-            # This is a placeholder for the actual implementation
+            # The session's FFmpeg process is started by the first frame and reused after;
+            # separate planes are gathered by writev instead of being joined first
+            self._ensure_ffmpeg(width, height, stride, pix_fmt)
+            planes = data if isinstance(data, (list, tuple)) else (data,)
+            self._queue_pipe_write(planes)
             
             # Update stats
             self._stats['frames_encoded'] += 1
@@ -122,10 +160,10 @@ class VideoToolboxEncoder(BaseEncoder):
     
     def flush(self):
         """Flush remaining frames"""
-        pass
+        self._close_ffmpeg()
     
-    def get_ffmpeg_args(self) -> list:
-        """Get FFmpeg arguments for VideoToolbox encoding"""
+    def _build_ffmpeg_args(self) -> list:
+        """Build FFmpeg arguments for VideoToolbox encoding"""
         args = []
         
         # Video codec
@@ -162,19 +200,7 @@ class VideoToolboxEncoder(BaseEncoder):
     
     def _get_videotoolbox_quality(self) -> Optional[int]:
         """Map preset to VideoToolbox quality value"""
-        quality_map = {
-            'ultrafast': 80,
-            'superfast': 70,
-            'veryfast': 60,
-            'faster': 50,
-            'fast': 40,
-            'medium': 30,
-            'slow': 20,
-            'slower': 15,
-            'veryslow': 10
-        }
-        
-        return quality_map.get(self._settings.preset.value)
+        return _VT_QUALITY.get(self._settings.preset)
     
     def get_videotoolbox_presets(self) -> dict:
         """Get VideoToolbox-specific presets"""
@@ -197,18 +223,8 @@ class VideoToolboxEncoder(BaseEncoder):
         }
     
     @staticmethod
-    def is_available() -> bool:
-        """Check if VideoToolbox is available on the system"""
-        if sys.platform != 'darwin':
-            return False
-        
-        try:
-            result = subprocess.run([
-                'ffmpeg', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=1',
-                '-c:v', 'h264_videotoolbox', '-f', 'null', '-'
-            ], capture_output=True, timeout=10)
-            
-            return result.returncode == 0
-            
-        except Exception:
-            return False
+    def is_available(force: bool = False, deep_probe: bool = False) -> bool:
+        """Check if VideoToolbox is available (force=True re-probes, deep_probe=True test-encodes)"""
+        if force:
+            _probe_videotoolbox.cache_clear()
+        return _probe_videotoolbox(deep_probe=True) if deep_probe else _probe_videotoolbox()
@@ -3,11 +3,8 @@ GoLive Studio - X264 Software Encoder
 Software H.264 encoding using libx264 via FFmpeg
 """
 
-import subprocess
-import threading
-from typing import Optional
+from dataclasses import replace
 from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QImage
 
 from .base_encoder import BaseEncoder, EncoderSettings, EncoderCapabilities, EncoderType, EncoderPreset, EncoderProfile
 
@@ -21,9 +18,6 @@ class X264Encoder(BaseEncoder):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self._process: Optional[subprocess.Popen] = None
-        self._encoding_thread: Optional[threading.Thread] = None
-        
     def get_capabilities(self) -> EncoderCapabilities:
         """Get X264 encoder capabilities"""
         return EncoderCapabilities(
@@ -47,7 +41,7 @@ class X264Encoder(BaseEncoder):
                 self._emit_error("Invalid encoder settings")
                 return False
             
-            self._settings = settings
+            self.set_settings(settings)
             self._capabilities = self.get_capabilities()
             self._initialized = True
             
@@ -84,35 +78,19 @@ class X264Encoder(BaseEncoder):
     def stop_encoding(self):
         """Stop X264 encoding session"""
         self._encoding = False
-        
-        if self._process:
-            try:
-                self._process.terminate()
-                self._process.wait(timeout=5)
-            except:
-                try:
-                    self._process.kill()
-                except:
-                    pass
-            self._process = None
-        
-        if self._encoding_thread and self._encoding_thread.is_alive():
-            self._encoding_thread.join(timeout=2)
+        self._close_ffmpeg()
     
-    def encode_frame(self, frame: QImage) -> bool:
-        """Encode frame using X264"""
-        if not self._encoding or not frame or frame.isNull():
+    def encode_raw(self, data, width: int, height: int, stride: int, pix_fmt: str) -> bool:
+        """Encode a raw frame using X264"""
+        if not self._encoding:
             return False
         
         try:
-            # Convert QImage to raw RGBA data
-            frame_rgba = frame.convertToFormat(QImage.Format.Format_RGBA8888)
-            width = frame_rgba.width()
-            height = frame_rgba.height()
-            
-            # For X264, we typically use FFmpeg process
-            # This is a simplified implementation - in practice, you'd use
-            # a more sophisticated approach with proper frame queuing
+            # The session's FFmpeg process is started by the first frame and reused after;
+            # separate planes are gathered by writev instead of being joined first
+            self._ensure_ffmpeg(width, height, stride, pix_fmt)
+            planes = data if isinstance(data, (list, tuple)) else (data,)
+            self._queue_pipe_write(planes)
             
             # Update stats
             self._stats['frames_encoded'] += 1
@@ -126,14 +104,10 @@ class X264Encoder(BaseEncoder):
     
     def flush(self):
         """Flush remaining frames"""
-        if self._process:
-            try:
-                self._process.stdin.close()
-            except:
-                pass
+        self._close_ffmpeg()
     
-    def get_ffmpeg_args(self) -> list:
-        """Get FFmpeg arguments for X264 encoding"""
+    def _build_ffmpeg_args(self) -> list:
+        """Build FFmpeg arguments for X264 encoding"""
         args = []
         
         # Video codec
@@ -220,16 +194,6 @@ class X264Encoder(BaseEncoder):
         if preset_name not in presets:
             return False
         
-        preset = presets[preset_name]
-        
-        # Update settings
-        if 'preset' in preset:
-            self._settings.preset = preset['preset']
-        if 'crf' in preset:
-            self._settings.crf = preset['crf']
-        if 'profile' in preset:
-            self._settings.profile = preset['profile']
-        if 'b_frames' in preset:
-            self._settings.b_frames = preset['b_frames']
-        
+        # Settings are immutable, so derive a new instance with the preset's fields
+        self.set_settings(replace(self._settings, **presets[preset_name]))
         return True